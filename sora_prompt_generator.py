@@ -14,8 +14,10 @@ Architecture:
 
 from __future__ import annotations
 
+import ast
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -67,16 +69,121 @@ class MetaphorMapping:
         return f"'{self.technical_term}' visual metaphor: {self.physical_gag}"
 
 
+# Regex fallbacks for files that fail to parse as Python
+_CLASS_RE = re.compile(r"^class\s+(\w+)\s*[:\(]", re.MULTILINE)
+_METHOD_RE = re.compile(r"def\s+(\w+)\s*\(", re.MULTILINE)
+_DOCSTRING_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+
+_ERROR_PATTERNS = (
+    "ModuleNotFoundError",
+    "ImportError",
+    "FileNotFoundError",
+    "PathNotFound",
+    "AttributeError",
+    "TypeError",
+    "ValueError",
+)
+# No pattern overlaps another, so one alternation finds every occurrence
+_ERROR_RE = re.compile("|".join(_ERROR_PATTERNS))
+
+_SIGNIFICANT_FILES = frozenset({
+    "config", "events", "recorder", "timeline", "narrator",
+    "video_processor", "uploader", "cli"
+})
+# Stems like "ide_recorder_cli" match by substring: one alternation scan
+_SIGNIFICANT_RE = re.compile("|".join(sorted(_SIGNIFICANT_FILES)))
+
+_THEME_KEYWORDS = {
+    "record": "recording",
+    "track": "tracking",
+    "generate": "generation",
+    "process": "processing",
+    "upload": "uploading",
+    "narration": "narration",
+    "stream": "streaming",
+    "cache": "caching",
+}
+
+_METAPHOR_KEYWORDS = {
+    "record": "recording tape that plays backward",
+    "track": "following a trail of breadcrumbs",
+    "timeline": "film strip fragments in wrong order",
+    "event": "things happening too fast to catch",
+    "path": "getting lost in apartment hallways",
+    "upload": "uploading thoughts into a cloud",
+    "narrator": "inner voice narrating everything",
+    "import": "importing physical objects",
+}
+
+
+# File reads are I/O-bound and release the GIL, so a small pool overlaps them
+_READ_WORKERS = 8
+
+_DOCSTRING_OWNERS = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _read_source(path: Path) -> "tuple[Path, Optional[str]]":
+    """Read a source file, returning None for content if it is unreadable."""
+    try:
+        return path, path.read_text(encoding="utf-8")
+    except (IOError, UnicodeDecodeError):
+        return path, None
+
+
+def _extract_source_concepts(
+    content: str, filename: str
+) -> "tuple[list[str], list[str], list[str]]":
+    """Extract class names, function names and docstrings from source.
+
+    Parses the module with ``ast`` once; falls back to regex scanning when
+    the file is not valid Python.
+
+    Args:
+        content: Python source text.
+        filename: File name used in parse error messages.
+
+    Returns:
+        Tuple of (top-level class names, function names, docstrings).
+    """
+    try:
+        tree = ast.parse(content, filename=filename)
+    except (SyntaxError, ValueError):
+        return (
+            _CLASS_RE.findall(content),
+            _METHOD_RE.findall(content),
+            [m.group(1) for m in _DOCSTRING_RE.finditer(content)],
+        )
+
+    classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+    methods: list[str] = []
+    docstrings: list[str] = []
+
+    module_doc = ast.get_docstring(tree, clean=False)
+    if module_doc:
+        docstrings.append(module_doc)
+
+    for node in ast.walk(tree):
+        if isinstance(node, _DOCSTRING_OWNERS):
+            if not isinstance(node, ast.ClassDef):
+                methods.append(node.name)
+            doc = ast.get_docstring(node, clean=False)
+            if doc:
+                docstrings.append(doc)
+
+    return classes, methods, docstrings
+
+
 class RepoAnalyzer:
     """Extracts programming concepts from repository."""
 
-    def __init__(self, repo_path: Path):
+    def __init__(self, repo_path: str | Path):
         """Initialize analyzer.
 
         Args:
             repo_path: Root path to repository.
         """
-        self.repo_path = Path(repo_path)
+        # Callers normally hand over a Path already; don't rebuild it
+        self.repo_path = repo_path if isinstance(repo_path, Path) else Path(repo_path)
         self.concepts = RepositoryConcepts()
 
     def analyze(self) -> RepositoryConcepts:
@@ -87,12 +194,8 @@ class RepoAnalyzer:
         """
         logger.info("Analyzing repository: %s", self.repo_path)
 
-        # Scan Python files
-        self._extract_classes()
-        self._extract_methods()
-        self._extract_errors()
-        self._extract_file_names()
-        self._extract_themes()
+        # Scan Python files once, then derive metaphors from the results
+        self._scan()
         self._infer_metaphors()
 
         logger.info("Extracted %d classes, %d error patterns",
@@ -100,126 +203,80 @@ class RepoAnalyzer:
 
         return self.concepts
 
-    def _extract_classes(self) -> None:
-        """Extract class names from Python files."""
-        class_pattern = re.compile(r"^class\s+(\w+)\s*[:\(]", re.MULTILINE)
-
-        for py_file in self.repo_path.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                matches = class_pattern.findall(content)
-                self.concepts.classes.extend(matches)
-            except (IOError, UnicodeDecodeError):
-                pass
+    def _scan(self) -> None:
+        """Read every Python file once and extract all concepts in one pass."""
+        # Ordered dedupe: set for O(1) membership, list to keep first-seen order
+        class_set: set[str] = set()
+        class_order: list[str] = []
+        file_set: set[str] = set()
+        file_order: list[str] = []
+        method_count: dict[str, int] = {}
+        error_set: set[str] = set()
+        found_themes: set[str] = set()
 
-        # Deduplicate and keep top 6
-        self.concepts.classes = list(dict.fromkeys(self.concepts.classes))[:6]
+        paths = list(self.repo_path.rglob("*.py"))
 
-    def _extract_methods(self) -> None:
-        """Extract common method names."""
-        method_pattern = re.compile(r"def\s+(\w+)\s*\(", re.MULTILINE)
-        method_count: dict[str, int] = {}
+        for py_file in paths:
+            stem = py_file.stem
+            if stem not in file_set and (
+                stem in _SIGNIFICANT_FILES or _SIGNIFICANT_RE.search(stem)
+            ):
+                file_set.add(stem)
+                file_order.append(stem)
+
+        # Reads run in the pool; parsing stays on this thread (CPU-bound)
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            for py_file, content in executor.map(_read_source, paths):
+                if content is None:
+                    continue
+
+                classes, methods, docstrings = _extract_source_concepts(
+                    content, str(py_file)
+                )
+
+                for name in classes:
+                    if name not in class_set:
+                        class_set.add(name)
+                        class_order.append(name)
+
+                for name in methods:
+                    method_count[name] = method_count.get(name, 0) + 1
+
+                if len(error_set) < len(_ERROR_PATTERNS):
+                    error_set.update(_ERROR_RE.findall(content))
+
+                for docstring in docstrings:
+                    docstring = docstring.lower()
+                    for keyword, theme in _THEME_KEYWORDS.items():
+                        if keyword in docstring:
+                            found_themes.add(theme)
 
-        for py_file in self.repo_path.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                matches = method_pattern.findall(content)
-                for m in matches:
-                    method_count[m] = method_count.get(m, 0) + 1
-            except (IOError, UnicodeDecodeError):
-                pass
+        self.concepts.classes = class_order[:6]
 
         # Get top recurring methods
         sorted_methods = sorted(method_count.items(), key=lambda x: x[1], reverse=True)
         self.concepts.key_methods = [m[0] for m in sorted_methods[:4]]
 
-    def _extract_errors(self) -> None:
-        """Extract common error patterns from comments and code."""
-        error_patterns = [
-            "ModuleNotFoundError",
-            "ImportError",
-            "FileNotFoundError",
-            "PathNotFound",
-            "AttributeError",
-            "TypeError",
-            "ValueError",
-        ]
-
-        for py_file in self.repo_path.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                for pattern in error_patterns:
-                    if pattern in content:
-                        self.concepts.error_patterns.append(pattern)
-            except (IOError, UnicodeDecodeError):
-                pass
-
-        self.concepts.error_patterns = list(dict.fromkeys(self.concepts.error_patterns))[:3]
-
-    def _extract_file_names(self) -> None:
-        """Extract significant file names."""
-        significant_files = [
-            "config", "events", "recorder", "timeline", "narrator",
-            "video_processor", "uploader", "cli"
-        ]
-
-        for py_file in self.repo_path.rglob("*.py"):
-            stem = py_file.stem
-            if any(sig in stem for sig in significant_files):
-                self.concepts.file_names.append(stem)
-
-        self.concepts.file_names = list(dict.fromkeys(self.concepts.file_names))[:5]
-
-    def _extract_themes(self) -> None:
-        """Extract themes from docstrings."""
-        docstring_pattern = re.compile(r'"""(.*?)"""', re.DOTALL)
-        theme_keywords = {
-            "record": "recording",
-            "track": "tracking",
-            "generate": "generation",
-            "process": "processing",
-            "upload": "uploading",
-            "narration": "narration",
-            "stream": "streaming",
-            "cache": "caching",
-        }
-
-        found_themes: set[str] = set()
-
-        for py_file in self.repo_path.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                for match in docstring_pattern.finditer(content):
-                    docstring = match.group(1).lower()
-                    for keyword, theme in theme_keywords.items():
-                        if keyword in docstring:
-                            found_themes.add(theme)
-            except (IOError, UnicodeDecodeError):
-                pass
-
+        # Presence-only: report in canonical order so output is deterministic
+        self.concepts.error_patterns = [
+            p for p in _ERROR_PATTERNS if p in error_set
+        ][:3]
+        self.concepts.file_names = file_order[:5]
         self.concepts.docstring_themes = list(found_themes)[:4]
 
     def _infer_metaphors(self) -> None:
         """Infer core metaphors from extracted data."""
-        # Build metaphor list from concepts
-        metaphor_keywords = {
-            "record": "recording tape that plays backward",
-            "track": "following a trail of breadcrumbs",
-            "timeline": "film strip fragments in wrong order",
-            "event": "things happening too fast to catch",
-            "path": "getting lost in apartment hallways",
-            "upload": "uploading thoughts into a cloud",
-            "narrator": "inner voice narrating everything",
-            "import": "importing physical objects",
-        }
+        seen: set[str] = set()
+        metaphors: list[str] = []
 
         for concept in (self.concepts.classes + self.concepts.file_names):
             concept_lower = concept.lower()
-            for keyword, metaphor in metaphor_keywords.items():
-                if keyword in concept_lower:
-                    self.concepts.core_metaphors.append(metaphor)
+            for keyword, metaphor in _METAPHOR_KEYWORDS.items():
+                if keyword in concept_lower and metaphor not in seen:
+                    seen.add(metaphor)
+                    metaphors.append(metaphor)
 
-        self.concepts.core_metaphors = list(dict.fromkeys(self.concepts.core_metaphors))[:4]
+        self.concepts.core_metaphors = metaphors[:4]
 
 
 class ConceptMapper:
@@ -477,6 +534,15 @@ class PromptOptimizer:
         "dramatically": "dramatic",
     }
 
+    # Compiled once rather than looked up in the re cache on every call
+    _SEPARATOR_RE = re.compile(r"---\n+")
+    _SCENE_HEADER_RE = re.compile(r"\*\*SCENE \d+:.*?\n")
+    # Matches (for deletion) every line lacking a key visual/story keyword
+    _DROP_LINE_RE = re.compile(
+        r"^(?!.*(?:metaphor|intertitle|visuals:|bro|kitchen)).*\n?",
+        re.MULTILINE | re.IGNORECASE,
+    )
+
     @staticmethod
     def compress_prompt(prompt: str, target_budget: TokenBudgetLevel) -> str:
         """Compress prompt to fit token budget.
@@ -495,22 +561,18 @@ class PromptOptimizer:
             prompt = prompt.replace(verbose, concise)
 
         # Remove excessive detail comments
-        prompt = re.sub(r"---\n+", "\n", prompt)
+        prompt = PromptOptimizer._SEPARATOR_RE.sub("\n", prompt)
 
         # Remove redundant section headers if too long
         if len(prompt) > target_budget.value * 4:  # ~4 chars per token
-            prompt = re.sub(r"\*\*SCENE \d+:.*?\n", "SCENE: ", prompt)
+            prompt = PromptOptimizer._SCENE_HEADER_RE.sub("SCENE: ", prompt)
 
         # Truncate descriptions if still over budget
         estimated_tokens = len(prompt) // 4
         if estimated_tokens > target_budget.value:
-            # Keep key visual and story elements, cut descriptive text
-            lines = prompt.split("\n")
-            kept_lines = [l for l in lines if any(
-                keyword in l.lower()
-                for keyword in ["metaphor", "intertitle", "visuals:", "bro", "kitchen"]
-            )]
-            prompt = "\n".join(kept_lines)
+            # Keep key visual and story elements, cut descriptive text.
+            # Kept lines are never empty, so rstrip only drops the final newline
+            prompt = PromptOptimizer._DROP_LINE_RE.sub("", prompt).rstrip("\n")
 
         return prompt
 
@@ -532,7 +594,7 @@ class SoraPromptGenerator:
 
     def __init__(
         self,
-        repo_path: Path,
+        repo_path: str | Path,
         budget: TokenBudgetLevel = TokenBudgetLevel.LOW,
     ):
         """Initialize generator.
@@ -541,17 +603,32 @@ class SoraPromptGenerator:
             repo_path: Path to repository.
             budget: Token budget level.
         """
-        self.repo_path = Path(repo_path)
+        self.repo_path = repo_path if isinstance(repo_path, Path) else Path(repo_path)
         self.budget = budget
         self.concepts: Optional[RepositoryConcepts] = None
         self.gags: list[MetaphorMapping] = []
+        self._rendered_story: Optional[str] = None
 
     def generate(self) -> str:
         """Generate optimized Sora prompt from repository.
 
+        Repository analysis runs only on the first call; changing
+        ``self.budget`` and calling again reuses the rendered story.
+
         Returns:
             Ready-to-use Sora prompt string.
         """
+        return self.generate_for_budget(self.budget)
+
+    def generate_base(self) -> str:
+        """Analyze repository and render the uncompressed story (cached).
+
+        Returns:
+            Rendered story before budget compression and Sora directives.
+        """
+        if self._rendered_story is not None:
+            return self._rendered_story
+
         logger.info("Starting prompt generation pipeline")
 
         # Step 1: Analyze repository
@@ -565,17 +642,29 @@ class SoraPromptGenerator:
         logger.info("Mapped %d gags from concepts", len(self.gags))
 
         # Step 3: Render story template with injected values
-        story = self._render_story()
+        self._rendered_story = self._render_story()
+        return self._rendered_story
+
+    def generate_for_budget(self, budget: TokenBudgetLevel) -> str:
+        """Generate optimized Sora prompt for a specific token budget.
+
+        Args:
+            budget: Token budget level to compress for.
+
+        Returns:
+            Ready-to-use Sora prompt string.
+        """
+        story = self.generate_base()
 
         # Step 4: Optimize for token budget
-        optimized = PromptOptimizer.compress_prompt(story, self.budget)
+        optimized = PromptOptimizer.compress_prompt(story, budget)
 
         # Step 5: Add final Sora-specific directives
         final_prompt = self._add_sora_directives(optimized)
 
         estimated = PromptOptimizer.estimate_tokens(final_prompt)
         logger.info("Generated prompt: %d estimated tokens (budget: %d)",
-                   estimated, self.budget.value)
+                   estimated, budget.value)
 
         return final_prompt
 
@@ -651,7 +740,7 @@ def build_prompt_from_repo(
     Returns:
         Ready-to-use Sora 2 prompt.
     """
-    generator = SoraPromptGenerator(Path(repo_path), budget=budget)
+    generator = SoraPromptGenerator(repo_path, budget=budget)
     return generator.generate()
 
 
@@ -1,5 +1,6 @@
 """Core dice rolling logic."""
 
+import logging
 import random
 from typing import Dict, List, Optional
 
@@ -21,8 +22,9 @@ class DiceRoller:
         Args:
             seed: Optional seed for reproducible rolls
         """
+        # Per-instance generator so seeding never touches global random state
+        self._rng = random.Random(seed)
         if seed is not None:
-            random.seed(seed)
             logger.debug("Dice roller seeded with %s", seed)
 
     def roll(self) -> int:
@@ -32,9 +34,7 @@ class DiceRoller:
         Returns:
             Integer between 1 and 6 (inclusive)
         """
-        result = random.randint(self.MIN_FACE, self.MAX_FACE)
-        logger.debug("Rolled: %s", result)
-        return result
+        return self._rng.randrange(self.MIN_FACE, self.MAX_FACE + 1)
 
     def roll_multiple(self, count: int) -> List[int]:
         """
@@ -52,8 +52,12 @@ class DiceRoller:
         if count <= 0:
             raise ValueError("Roll count must be a positive integer")
 
-        rolls = [self.roll() for _ in range(count)]
-        logger.info("Performed %s rolls: %s", count, rolls)
+        # Bind locally: no per-roll method dispatch or logging in the hot loop
+        randrange = self._rng.randrange
+        low, high = self.MIN_FACE, self.MAX_FACE + 1
+        rolls = [randrange(low, high) for _ in range(count)]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Performed %s rolls: %s", count, rolls)
         return rolls
 
     @staticmethod
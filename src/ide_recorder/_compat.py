@@ -0,0 +1,15 @@
+"""
+_compat.py - Python version compatibility helpers for IDE recorder.
+
+The package supports Python 3.9+, but some dataclass options only exist on
+newer interpreters. Use these keyword sets instead of version checks inline.
+"""
+
+from __future__ import annotations
+
+import sys
+
+# dataclass(slots=True) arrived in Python 3.10; older versions keep __dict__
+DATACLASS_SLOTS: dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
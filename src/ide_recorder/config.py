@@ -11,15 +11,129 @@ Handles recorder settings including:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import functools
+import itertools
+import typing
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import json
 
+from src.ide_recorder._compat import DATACLASS_SLOTS
 
-@dataclass
-class ScreenCaptureConfig:
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # Optional accelerator; stdlib json is the fallback
+    _HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:  # Optional accelerator; stdlib json is the fallback
+    _HAS_MSGSPEC = False
+
+# Credentials left out of saved configs unless to_json is asked to keep them
+_SECRET_FIELDS: dict[str, tuple[str, ...]] = {
+    "narration": ("api_key",),
+    "youtube": ("client_secret", "refresh_token"),
+}
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode values the JSON backends cannot serialize natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to JSON")
+
+
+def _dec_hook(type_: type, obj: Any) -> Any:
+    """Decode values the JSON backends cannot produce natively."""
+    if type_ is Path:
+        return Path(obj)
+    raise NotImplementedError(f"Cannot decode {type_.__name__} from JSON")
+
+
+@functools.lru_cache(maxsize=None)
+def _field_types(cls: type) -> dict[str, Any]:
+    """Resolve the (string) field annotations of a config dataclass once."""
+    hints = typing.get_type_hints(cls)
+    return {f.name: hints[f.name] for f in fields(cls) if f.init}
+
+
+def _config_from_dict(cls: type, data: Any) -> Any:
+    """Build a config dataclass from decoded JSON without msgspec.
+
+    Nested sub-configs are built from their objects and ``Path`` fields from
+    strings; keys that are not fields are ignored. Other values are passed
+    through unchecked.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"Expected a JSON object for {cls.__name__}, got {type(data).__name__}"
+        )
+    kwargs = {}
+    for name, type_ in _field_types(cls).items():
+        if name not in data:
+            continue
+        value = data[name]
+        if isinstance(type_, type) and is_dataclass(type_):
+            value = _config_from_dict(type_, value)
+        elif type_ is Path:
+            if not isinstance(value, str):
+                raise ValueError(f"Expected a string path for {name!r}")
+            value = Path(value)
+        kwargs[name] = value
+    return cls(**kwargs)
+
+
+def _encode_config(config: RecorderConfig, include_secrets: bool = False) -> bytes:
+    """Encode a config dataclass to indented JSON bytes.
+
+    msgspec converts the dataclass tree to builtins in C; without it the
+    stdlib ``asdict`` is used. Either way the fields in ``_SECRET_FIELDS``
+    are dropped unless ``include_secrets`` is set.
+    """
+    if _HAS_MSGSPEC:
+        data = msgspec.to_builtins(config, enc_hook=_enc_hook)
+    else:
+        data = asdict(config)
+    if not include_secrets:
+        for section, names in _SECRET_FIELDS.items():
+            for name in names:
+                data[section].pop(name, None)
+    if _HAS_MSGSPEC:
+        return msgspec.json.format(msgspec.json.encode(data), indent=2)
+    if _HAS_ORJSON:
+        return orjson.dumps(data, default=_enc_hook, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, default=_enc_hook, indent=2).encode("utf-8")
+
+
+# Source of per-object version stamps; drawing from one counter keeps stamps
+# unique across objects, so swapping in another sub-config also changes them.
+_config_versions = itertools.count(1)
+
+
+class _TrackedConfig:
+    """Base for config dataclasses that stamps a new version on each write."""
+
+    __slots__ = ("_version",)
+    _version: int
+
+    def __post_init__(self) -> None:
+        # Decoders such as msgspec set fields without going through __setattr__
+        object.__setattr__(self, "_version", next(_config_versions))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, "_version", next(_config_versions))
+        object.__setattr__(self, name, value)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ScreenCaptureConfig(_TrackedConfig):
     """Screen capture settings."""
 
     fps: int = 30
@@ -30,8 +144,8 @@ class ScreenCaptureConfig:
     monitor_index: int = 0
 
 
-@dataclass
-class EventTrackingConfig:
+@dataclass(**DATACLASS_SLOTS)
+class EventTrackingConfig(_TrackedConfig):
     """Event tracking settings."""
 
     track_file_changes: bool = True
@@ -41,8 +155,8 @@ class EventTrackingConfig:
     update_interval_ms: int = 500
 
 
-@dataclass
-class NarrationConfig:
+@dataclass(**DATACLASS_SLOTS)
+class NarrationConfig(_TrackedConfig):
     """AI narration settings."""
 
     enabled: bool = True
@@ -55,8 +169,8 @@ class NarrationConfig:
     max_tokens: int = 150
 
 
-@dataclass
-class VideoProcessingConfig:
+@dataclass(**DATACLASS_SLOTS)
+class VideoProcessingConfig(_TrackedConfig):
     """Video processing settings."""
 
     enable_transitions: bool = True
@@ -70,8 +184,8 @@ class VideoProcessingConfig:
     output_path: Path = field(default_factory=lambda: Path("./output"))
 
 
-@dataclass
-class YouTubeUploadConfig:
+@dataclass(**DATACLASS_SLOTS)
+class YouTubeUploadConfig(_TrackedConfig):
     """YouTube upload settings."""
 
     enabled: bool = False
@@ -85,8 +199,16 @@ class YouTubeUploadConfig:
     privacy_level: str = "private"  # private, unlisted, public
 
 
-@dataclass
-class RecorderConfig:
+class _DictCachingConfig(_TrackedConfig):
+    """Holds the cached to_dict result outside the dataclass fields."""
+
+    __slots__ = ("_dict_cache", "_dict_cache_key")
+    _dict_cache: Optional[dict[str, Any]]
+    _dict_cache_key: tuple[int, ...]
+
+
+@dataclass(**DATACLASS_SLOTS)
+class RecorderConfig(_DictCachingConfig):
     """Main recorder configuration combining all sub-configs."""
 
     project_name: str = "ide_recording"
@@ -104,8 +226,32 @@ class RecorderConfig:
     debug_mode: bool = False
     log_level: str = "INFO"
 
-    def to_dict(self) -> dict:
-        """Convert config to dictionary."""
+    def __post_init__(self) -> None:
+        _TrackedConfig.__post_init__(self)
+        object.__setattr__(self, "_dict_cache", None)
+        object.__setattr__(self, "_dict_cache_key", ())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert config to a summary dictionary (for logging and display).
+
+        The dict is cached until this config or one of the sub-configs it
+        summarizes changes; treat the returned value as read-only.
+        """
+        key = (
+            self._version,
+            self.screen_capture._version,
+            self.event_tracking._version,
+            self.narration._version,
+        )
+        cached = self._dict_cache
+        if cached is None or key != self._dict_cache_key:
+            cached = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cached)
+            object.__setattr__(self, "_dict_cache_key", key)
+        return cached
+
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the summary dictionary returned by to_dict."""
         return {
             "project_name": self.project_name,
             "output_directory": str(self.output_directory),
@@ -131,22 +277,33 @@ class RecorderConfig:
 
     @classmethod
     def from_json(cls, json_path: Path) -> RecorderConfig:
-        """Load config from JSON file."""
-        with open(json_path, "r") as f:
-            data = json.load(f)
-
-        config = cls()
-        if "project_name" in data:
-            config.project_name = data["project_name"]
-        if "output_directory" in data:
-            config.output_directory = Path(data["output_directory"])
-        if "debug_mode" in data:
-            config.debug_mode = data["debug_mode"]
+        """Load config from JSON file.
 
+        Every field written by to_json is restored, including the nested
+        sub-configs; missing keys keep their defaults and unknown keys are
+        ignored. With msgspec installed every value is type-checked;
+        otherwise only sub-configs and paths are.
+
+        Raises:
+            ValueError: If a value has the wrong type for its field.
+        """
+        raw = Path(json_path).read_bytes()
+        config: RecorderConfig
+        if _HAS_MSGSPEC:
+            config = msgspec.json.decode(raw, type=cls, dec_hook=_dec_hook)
+        else:
+            data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+            config = _config_from_dict(cls, data)
         return config
 
-    def to_json(self, json_path: Path) -> None:
-        """Save config to JSON file."""
+    def to_json(self, json_path: Path, include_secrets: bool = False) -> None:
+        """Save config to JSON file, one key per dataclass field.
+
+        Args:
+            json_path: Destination file.
+            include_secrets: Also write the API key, client secret and
+                refresh token. Off by default so credentials are not left
+                on disk in plaintext.
+        """
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(json_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        json_path.write_bytes(_encode_config(self, include_secrets))
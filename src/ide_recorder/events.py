@@ -8,19 +8,37 @@ Monitors IDE activity including:
 - Code completions and suggestions
 
 Events are timestamped and categorized for use in timeline generation.
+Set ``event_log_path`` in the tracker config to also stream every event to
+disk as length-prefixed JSON frames (see read_event_log). Only the most recent
+``max_in_memory_events`` events (default 50,000) are kept in memory; the log
+holds the full session.
 """
 
 from __future__ import annotations
 
+import bisect
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, List, Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Iterator, List, Mapping, Optional
 from datetime import datetime
+import json
 import logging
+import time
+
+from src.ide_recorder._compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_IN_MEMORY_EVENTS = 50_000
+
+# Event log frames: 4-byte big-endian payload length, then UTF-8 JSON
+_FRAME_HEADER_SIZE = 4
+# Reused for every frame; json.dumps with options builds a new encoder per call
+_LOG_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
 
 class EventType(Enum):
     """Enumeration of IDE event types."""
@@ -74,12 +92,34 @@ class EventSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Enum .value goes through a descriptor; plain dict lookups are cheaper
+# when serializing a whole session's worth of events.
+_EVENT_VALUES: dict[EventType, str] = {e: e.value for e in EventType}
+_SEVERITY_VALUES: dict[EventSeverity, str] = {s: s.value for s in EventSeverity}
+
+# Members used by the track_* helpers, bound once so the hot path reads a
+# module global instead of resolving the member through the enum class.
+_ET_RECORDING_STARTED = EventType.RECORDING_STARTED
+_ET_RECORDING_STOPPED = EventType.RECORDING_STOPPED
+_ET_FILE_SAVED = EventType.FILE_SAVED
+_ET_FILE_MODIFIED = EventType.FILE_MODIFIED
+_ET_TEST_RUN_COMPLETED = EventType.TEST_RUN_COMPLETED
+_ET_GIT_COMMIT = EventType.GIT_COMMIT
+_ET_CURSOR_MOVED = EventType.CURSOR_MOVED
+_SEV_INFO = EventSeverity.INFO
+_SEV_WARNING = EventSeverity.WARNING
+
+# Shared read-only metadata for the common case of events that carry none;
+# IDEEvent.set_metadata replaces it rather than writing into it.
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(**DATACLASS_SLOTS)
 class IDEEvent:
     """Represents a single IDE event captured during recording."""
 
     event_type: EventType
-    timestamp: datetime
+    timestamp: int  # Nanoseconds since the epoch, from time.time_ns()
     severity: EventSeverity = EventSeverity.INFO
 
     # Event-specific metadata
@@ -87,25 +127,73 @@ class IDEEvent:
     line_number: Optional[int] = None
     column_number: Optional[int] = None
     content: Optional[str] = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_META)
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Set a metadata entry by replacing the metadata with an updated copy.
+
+        The mapping passed in (or the shared empty default) is never mutated.
+
+        Args:
+            key: Metadata key.
+            value: Metadata value.
+        """
+        self.metadata = {**self.metadata, key: value}
+
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Event time as a local datetime, truncated to whole microseconds."""
+        seconds, nanos = divmod(self.timestamp, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1_000)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert event to dictionary."""
+        """Convert event to dictionary (timestamp in epoch nanoseconds)."""
         return {
-            "event_type": self.event_type.value,
-            "timestamp": self.timestamp.isoformat(),
-            "severity": self.severity.value,
+            "event_type": _EVENT_VALUES[self.event_type],
+            "timestamp": self.timestamp,
+            "severity": _SEVERITY_VALUES[self.severity],
             "file_path": str(self.file_path) if self.file_path else None,
             "line_number": self.line_number,
             "column_number": self.column_number,
             "content": self.content,
-            "metadata": self.metadata,
+            "metadata": self.metadata if self.metadata is not _EMPTY_META else {},
         }
 
     def __str__(self) -> str:
         """String representation of event."""
-        time_str = self.timestamp.strftime("%H:%M:%S")
-        return f"[{time_str}] {self.event_type.value}: {self.file_path or self.content or 'N/A'}"
+        time_str = self.timestamp_dt.strftime("%H:%M:%S")
+        target = self.file_path or self.content or "N/A"
+        return f"[{time_str}] {_EVENT_VALUES[self.event_type]}: {target}"
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to epoch nanoseconds at microsecond precision."""
+    return round(value.timestamp() * 1_000_000) * 1_000
+
+
+def read_event_log(log_path: Path) -> Iterator[dict[str, Any]]:
+    """Replay events written to an event log by EventTracker.
+
+    A frame cut short by a crash mid-write ends the replay instead of
+    raising, so everything written before it is still recovered.
+
+    Args:
+        log_path: Path to the event log file.
+
+    Yields:
+        Event dictionaries in the format of IDEEvent.to_dict.
+    """
+    with open(log_path, "rb") as f:
+        while True:
+            header = f.read(_FRAME_HEADER_SIZE)
+            if len(header) < _FRAME_HEADER_SIZE:
+                return
+            size = int.from_bytes(header, "big")
+            payload = f.read(size)
+            if len(payload) < size:
+                logger.warning(f"Truncated event log frame in {log_path}")
+                return
+            yield json.loads(payload)
 
 
 class EventTracker:
@@ -118,17 +206,43 @@ class EventTracker:
             config: Configuration dictionary with tracking options.
         """
         self.config = config or {}
-        self.events: List[IDEEvent] = []
+        # Ring buffer: once full, the oldest event is evicted for each new one.
+        # None disables the cap.
+        max_events = self.config.get(
+            "max_in_memory_events", DEFAULT_MAX_IN_MEMORY_EVENTS
+        )
+        if max_events is not None and (
+            not isinstance(max_events, int)
+            or isinstance(max_events, bool)
+            or max_events < 1
+        ):
+            raise ValueError("max_in_memory_events must be a positive integer or None")
+        self._max_events: Optional[int] = max_events
+        self.events: deque[IDEEvent] = deque()
+        # Sorted side index for bisect. Lists, since indexing a deque is O(n);
+        # evicted entries stay below _index_start until compacted in a batch.
+        self._timestamps: list[int] = []
+        self._ordered: list[IDEEvent] = []
+        self._index_start = 0
+        # Per-type index and counts, maintained on insert so lookups don't scan
+        self._by_type: defaultdict[EventType, deque[IDEEvent]] = defaultdict(deque)
+        self._type_counts: Counter[EventType] = Counter()
         self.callbacks: dict[EventType, List[Callable[[IDEEvent], None]]] = {}
+        # Immutable snapshots of self.callbacks used for dispatch; empty dict
+        # (the common case) lets track_event skip callback handling entirely
+        self._dispatch: dict[EventType, tuple[Callable[[IDEEvent], None], ...]] = {}
         self.recording_active = False
+        self._log: Optional[BinaryIO] = None
 
     def start_tracking(self) -> None:
         """Start tracking events."""
+        log_path = self.config.get("event_log_path")
+        if log_path and self._log is None:
+            self._log = open(log_path, "ab")
         self.recording_active = True
         event = IDEEvent(
-            event_type=EventType.RECORDING_STARTED,
-            timestamp=datetime.now(),
-            severity=EventSeverity.INFO,
+            event_type=_ET_RECORDING_STARTED,
+            timestamp=time.time_ns(),
         )
         self.track_event(event)
         logger.info("Event tracking started")
@@ -137,11 +251,13 @@ class EventTracker:
         """Stop tracking events."""
         self.recording_active = False
         event = IDEEvent(
-            event_type=EventType.RECORDING_STOPPED,
-            timestamp=datetime.now(),
-            severity=EventSeverity.INFO,
+            event_type=_ET_RECORDING_STOPPED,
+            timestamp=time.time_ns(),
         )
         self.track_event(event)
+        if self._log is not None:
+            self._log.close()
+            self._log = None
         logger.info("Event tracking stopped")
 
     def track_event(self, event: IDEEvent) -> None:
@@ -153,17 +269,68 @@ class EventTracker:
         if not self.recording_active:
             return
 
-        self.events.append(event)
-        logger.debug(f"Event tracked: {event}")
+        # Hot path: read each event attribute once into a local
+        event_type = event.event_type
+        timestamp = event.timestamp
+        events = self.events
+        timestamps = self._timestamps
+        if len(events) == self._max_events:
+            self._evict_oldest()
+        if not events or timestamp >= timestamps[-1]:
+            events.append(event)
+            timestamps.append(timestamp)
+            self._ordered.append(event)
+        else:
+            # Clock stepped back or caller supplied an older event
+            start = self._index_start
+            index = bisect.bisect_right(timestamps, timestamp, start)
+            events.insert(index - start, event)
+            timestamps.insert(index, timestamp)
+            self._ordered.insert(index, event)
+        self._by_type[event_type].append(event)
+        self._type_counts[event_type] += 1
+
+        log = self._log
+        if log is not None:
+            payload = _LOG_ENCODER.encode(event.to_dict()).encode("utf-8")
+            log.write(len(payload).to_bytes(_FRAME_HEADER_SIZE, "big") + payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event tracked: %s", event)
 
         # Trigger callbacks for this event type
-        if event.event_type in self.callbacks:
-            for callback in self.callbacks[event.event_type]:
+        if self._dispatch:
+            for callback in self._dispatch.get(event_type, ()):
                 try:
                     callback(event)
                 except Exception as e:
                     logger.error(f"Error in event callback: {e}")
 
+    def _evict_oldest(self) -> None:
+        """Drop the oldest in-memory event from the buffer and its indexes."""
+        oldest = self.events.popleft()
+        self._index_start += 1
+        if self._index_start * 2 >= len(self._timestamps):
+            # Dead prefix is at least half the index: drop it in one go, which
+            # keeps eviction amortized O(1)
+            del self._timestamps[: self._index_start]
+            del self._ordered[: self._index_start]
+            self._index_start = 0
+        event_type = oldest.event_type
+        bucket = self._by_type[event_type]
+        if bucket[0] is oldest:
+            bucket.popleft()
+        else:
+            # Per-type buckets are in arrival order; an out-of-order insert
+            # can leave the globally oldest event further in
+            for index, candidate in enumerate(bucket):
+                if candidate is oldest:
+                    del bucket[index]
+                    break
+        if bucket:
+            self._type_counts[event_type] -= 1
+        else:
+            del self._by_type[event_type], self._type_counts[event_type]
+
     def track_file_saved(self, file_path: Path, content: Optional[str] = None) -> None:
         """Track file save event.
 
@@ -171,14 +338,22 @@ class EventTracker:
             file_path: Path to saved file.
             content: Optional file content.
         """
-        event = IDEEvent(
-            event_type=EventType.FILE_SAVED,
-            timestamp=datetime.now(),
-            severity=EventSeverity.INFO,
-            file_path=file_path,
-            content=content,
+        if not self.recording_active:
+            return
+
+        # High-rate helper: build the event positionally (event_type,
+        # timestamp, severity, file_path, line_number, column_number, content)
+        self.track_event(
+            IDEEvent(
+                _ET_FILE_SAVED,
+                time.time_ns(),
+                _SEV_INFO,
+                file_path,
+                None,
+                None,
+                content,
+            )
         )
-        self.track_event(event)
 
     def track_file_modified(self, file_path: Path) -> None:
         """Track file modification.
@@ -187,9 +362,8 @@ class EventTracker:
             file_path: Path to modified file.
         """
         event = IDEEvent(
-            event_type=EventType.FILE_MODIFIED,
-            timestamp=datetime.now(),
-            severity=EventSeverity.INFO,
+            event_type=_ET_FILE_MODIFIED,
+            timestamp=time.time_ns(),
             file_path=file_path,
         )
         self.track_event(event)
@@ -202,9 +376,9 @@ class EventTracker:
             passed: Whether test passed.
         """
         event = IDEEvent(
-            event_type=EventType.TEST_RUN_COMPLETED,
-            timestamp=datetime.now(),
-            severity=EventSeverity.INFO if passed else EventSeverity.WARNING,
+            event_type=_ET_TEST_RUN_COMPLETED,
+            timestamp=time.time_ns(),
+            severity=_SEV_INFO if passed else _SEV_WARNING,
             content=test_name,
             metadata={"passed": passed},
         )
@@ -218,9 +392,8 @@ class EventTracker:
             files_changed: Number of files changed.
         """
         event = IDEEvent(
-            event_type=EventType.GIT_COMMIT,
-            timestamp=datetime.now(),
-            severity=EventSeverity.INFO,
+            event_type=_ET_GIT_COMMIT,
+            timestamp=time.time_ns(),
             content=commit_message,
             metadata={"files_changed": files_changed},
         )
@@ -236,15 +409,16 @@ class EventTracker:
             line: Line number.
             column: Column number.
         """
-        event = IDEEvent(
-            event_type=EventType.CURSOR_MOVED,
-            timestamp=datetime.now(),
-            severity=EventSeverity.INFO,
-            file_path=file_path,
-            line_number=line,
-            column_number=column,
+        if not self.recording_active:
+            return
+
+        # High-rate helper: build the event positionally (event_type,
+        # timestamp, severity, file_path, line_number, column_number)
+        self.track_event(
+            IDEEvent(
+                _ET_CURSOR_MOVED, time.time_ns(), _SEV_INFO, file_path, line, column
+            )
         )
-        self.track_event(event)
 
     def register_callback(
         self, event_type: EventType, callback: Callable[[IDEEvent], None]
@@ -258,6 +432,7 @@ class EventTracker:
         if event_type not in self.callbacks:
             self.callbacks[event_type] = []
         self.callbacks[event_type].append(callback)
+        self._dispatch[event_type] = tuple(self.callbacks[event_type])
 
     def get_events_by_type(self, event_type: EventType) -> List[IDEEvent]:
         """Get all events of a specific type.
@@ -268,13 +443,17 @@ class EventTracker:
         Returns:
             List of matching events.
         """
-        return [e for e in self.events if e.event_type == event_type]
+        return list(self._by_type.get(event_type, ()))
 
     def get_events_in_timerange(
         self, start: datetime, end: datetime
     ) -> List[IDEEvent]:
         """Get events within a time range.
 
+        Both bounds are inclusive and compared at microsecond precision,
+        the resolution of datetime, so an event's own timestamp_dt always
+        falls inside a range that ends (or starts) there.
+
         Args:
             start: Start timestamp.
             end: End timestamp.
@@ -282,11 +461,21 @@ class EventTracker:
         Returns:
             List of events in range.
         """
-        return [e for e in self.events if start <= e.timestamp <= end]
+        timestamps = self._timestamps
+        first = self._index_start
+        lo = bisect.bisect_left(timestamps, _datetime_to_ns(start), first)
+        # Any nanosecond within the end microsecond still matches it
+        hi = bisect.bisect_right(timestamps, _datetime_to_ns(end) + 999, first)
+        return self._ordered[lo:hi]
 
     def clear_events(self) -> None:
         """Clear all tracked events."""
         self.events.clear()
+        self._timestamps.clear()
+        self._ordered.clear()
+        self._index_start = 0
+        self._by_type.clear()
+        self._type_counts.clear()
         logger.info("Events cleared")
 
     def get_statistics(self) -> dict[str, Any]:
@@ -295,17 +484,17 @@ class EventTracker:
         Returns:
             Dictionary with event statistics.
         """
-        event_counts = {}
-        for event in self.events:
-            event_type = event.event_type.value
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+        event_counts = {
+            _EVENT_VALUES[event_type]: count
+            for event_type, count in self._type_counts.items()
+        }
 
         return {
             "total_events": len(self.events),
             "event_types": len(event_counts),
             "event_counts": event_counts,
             "duration_seconds": (
-                (self.events[-1].timestamp - self.events[0].timestamp).total_seconds()
+                (self.events[-1].timestamp - self.events[0].timestamp) / 1e9
                 if self.events
                 else 0
             ),
@@ -104,7 +104,7 @@ class TimelineManager:
                     step_count,
                     step_events,
                     step_start,
-                    event.timestamp,
+                    event.timestamp_dt,
                     step_category,
                 )
                 if step.duration_seconds >= self.min_step_duration:
@@ -117,7 +117,7 @@ class TimelineManager:
 
             step_events.append(event)
             if step_start is None:
-                step_start = event.timestamp
+                step_start = event.timestamp_dt
 
             # Update category based on event type
             step_category = self._get_event_category(event)
@@ -125,7 +125,11 @@ class TimelineManager:
         # Add final step
         if step_events and step_start:
             step = self._create_step(
-                step_count, step_events, step_start, events[-1].timestamp, step_category
+                step_count,
+                step_events,
+                step_start,
+                events[-1].timestamp_dt,
+                step_category,
             )
             if step.duration_seconds >= self.min_step_duration:
                 self.steps.append(step)
@@ -15,14 +15,52 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
+import http.client
+import json
 import logging
+import random
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+from urllib.parse import urlencode, urlsplit
+
+from src.ide_recorder._compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# YouTube Data API resumable upload protocol
+UPLOAD_HOST = "www.googleapis.com"
+UPLOAD_PATH = "/upload/youtube/v3/videos?uploadType=resumable&part=snippet,status"
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Must be a multiple of 256 KiB
+UPLOAD_MAX_RETRIES = 5
+UPLOAD_TIMEOUT_SECONDS = 60
+# Exponential backoff between retries: base * 2**(attempt - 1), capped, jittered
+UPLOAD_BACKOFF_BASE_SECONDS = 1.0
+UPLOAD_BACKOFF_MAX_SECONDS = 32.0
+# Server errors after which the upload is resumed rather than abandoned
+UPLOAD_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+OAUTH_HOST = "oauth2.googleapis.com"
+OAUTH_TOKEN_PATH = "/token"
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt`` (starting at 1).
+
+    The delay doubles per attempt up to UPLOAD_BACKOFF_MAX_SECONDS, and is
+    scaled by a random factor in [0.5, 1] so parallel uploads that failed
+    together do not retry in lockstep.
+    """
+    ceiling = min(
+        UPLOAD_BACKOFF_MAX_SECONDS, UPLOAD_BACKOFF_BASE_SECONDS * 2.0 ** (attempt - 1)
+    )
+    return ceiling * random.uniform(0.5, 1.0)
+
 
 class PrivacyLevel(Enum):
     """YouTube privacy levels."""
@@ -32,7 +70,7 @@ class PrivacyLevel(Enum):
     PRIVATE = "private"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VideoMetadata:
     """Video metadata for upload."""
 
@@ -67,13 +105,77 @@ class YouTubeUploader:
         self.client_secret = client_secret
         self.refresh_token = refresh_token
         self.channel_id = channel_id
-        self.access_token: Optional[str] = None
+        # Fetched lazily on first use; no network traffic until an upload
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0  # time.monotonic() deadline
+        # Kept alive across API calls so each one skips the TCP + TLS handshake.
+        # One per thread: a connection can't carry overlapping requests, and
+        # upload_video_async runs uploads on worker threads.
+        self._local = threading.local()
+        self._conns: set[http.client.HTTPConnection] = set()
+        self._conns_lock = threading.Lock()
 
         logger.info(f"YouTubeUploader initialized for channel: {channel_id}")
 
+    def __enter__(self) -> YouTubeUploader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled API connections of every thread."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, set()
+            self._local = threading.local()
+        for conn in conns:
+            conn.close()
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return this thread's pooled connection to the Google API host.
+
+        http.client reopens the socket on the next request after a close,
+        so callers can close it to recover from errors and keep using it;
+        doing so never affects uploads running on other threads.
+        """
+        conn: Optional[http.client.HTTPConnection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._new_connection()
+            with self._conns_lock:
+                self._local.conn = conn
+                self._conns.add(conn)
+        return conn
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Open a connection to the Google API upload host."""
+        return http.client.HTTPSConnection(UPLOAD_HOST, timeout=UPLOAD_TIMEOUT_SECONDS)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """OAuth2 access token, refreshed on first use and shortly before expiry.
+
+        If a refresh fails while the current token is still valid, the
+        current token keeps being used until it actually expires.
+        """
+        now = time.monotonic()
+        if (
+            self._access_token is None
+            or now >= self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+        ):
+            try:
+                self._refresh_access_token()
+            except Exception as e:
+                if self._access_token is None or now >= self._token_expires_at:
+                    raise
+                logger.warning(f"Token refresh failed, reusing current token: {e}")
+        return self._access_token
+
     def authenticate(self) -> bool:
         """Authenticate with YouTube API.
 
+        Uploads authenticate on demand; call this to validate credentials
+        up front.
+
         Returns:
             True if authentication successful.
         """
@@ -90,16 +192,51 @@ class YouTubeUploader:
             return False
 
     def _refresh_access_token(self) -> None:
-        """Refresh OAuth2 access token."""
-        # Implementation would make POST request to YouTube OAuth endpoint
-        # with refresh_token to get new access_token
+        """Refresh OAuth2 access token.
+
+        Raises:
+            RuntimeError: If no refresh token is configured or the token
+                endpoint rejects the request.
+        """
+        if not self.refresh_token:
+            raise RuntimeError("No refresh token configured")
+
         logger.debug("Refreshing access token")
+        body = urlencode(
+            {
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": self.refresh_token,
+                "grant_type": "refresh_token",
+            }
+        )
+
+        # Refreshes happen about hourly, so this connection isn't pooled
+        conn = http.client.HTTPSConnection(OAUTH_HOST, timeout=UPLOAD_TIMEOUT_SECONDS)
+        try:
+            conn.request(
+                "POST",
+                OAUTH_TOKEN_PATH,
+                body=body,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            response = conn.getresponse()
+            payload = response.read()
+        finally:
+            conn.close()
+
+        if response.status != 200:
+            raise RuntimeError(f"Token refresh failed with HTTP {response.status}")
+
+        data = json.loads(payload)
+        self._access_token = data["access_token"]
+        self._token_expires_at = time.monotonic() + float(data.get("expires_in", 3600))
 
     def upload_video(
         self,
         video_path: Path,
         metadata: VideoMetadata,
-        on_progress: Optional[callable] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
     ) -> Optional[str]:
         """Upload video to YouTube.
 
@@ -111,9 +248,9 @@ class YouTubeUploader:
         Returns:
             Video ID if successful, None otherwise.
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return None
+        if not self.refresh_token:
+            logger.error("No refresh token configured")
+            return None
 
         if not video_path.exists():
             logger.error(f"Video file not found: {video_path}")
@@ -124,10 +261,6 @@ class YouTubeUploader:
         logger.info(f"Privacy: {metadata.privacy_level.value}")
 
         try:
-            # Implementation would use YouTube API
-            # POST to https://www.googleapis.com/youtube/v3/videos
-            # with resumable upload protocol for large files
-
             video_id = self._do_upload(video_path, metadata, on_progress)
 
             if video_id:
@@ -141,13 +274,41 @@ class YouTubeUploader:
             logger.error(f"Upload error: {e}")
             return None
 
+    async def upload_video_async(
+        self,
+        video_path: Path,
+        metadata: VideoMetadata,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Optional[str]:
+        """Upload video without blocking the calling event loop.
+
+        Runs upload_video in a worker thread so recording can continue
+        while the file is sent.
+
+        Args:
+            video_path: Path to video file to upload.
+            metadata: Video metadata (title, description, tags, etc.).
+            on_progress: Callback for upload progress (bytes_uploaded, total_bytes).
+
+        Returns:
+            Video ID if successful, None otherwise.
+        """
+        return await asyncio.to_thread(
+            self.upload_video, video_path, metadata, on_progress
+        )
+
     def _do_upload(
         self,
         video_path: Path,
         metadata: VideoMetadata,
-        on_progress: Optional[callable] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
     ) -> Optional[str]:
-        """Perform actual upload.
+        """Perform actual upload using the resumable upload protocol.
+
+        The file is streamed in UPLOAD_CHUNK_SIZE pieces. After a network
+        error or a 500/502/503/504 response the uploader backs off, asks
+        the server how many bytes it has and resumes from there instead of
+        restarting at byte 0.
 
         Args:
             video_path: Path to video.
@@ -157,9 +318,154 @@ class YouTubeUploader:
         Returns:
             Video ID or None.
         """
-        # Placeholder implementation
-        logger.debug(f"Uploading {video_path.name} ({video_path.stat().st_size} bytes)")
-        return "placeholder_video_id"
+        total = video_path.stat().st_size
+        if total == 0:
+            logger.error(f"Video file is empty: {video_path}")
+            return None
+        logger.debug(f"Uploading {video_path.name} ({total} bytes)")
+
+        conn = self._get_connection()
+        try:
+            session_path = self._start_upload_session(conn, metadata, total)
+            offset = 0
+            retries = 0
+            resync = False
+
+            with open(video_path, "rb") as f:
+                while True:
+                    if resync:
+                        # Empty PUT asks the server which bytes it already has
+                        chunk = b""
+                        content_range = f"bytes */{total}"
+                    else:
+                        f.seek(offset)
+                        chunk = f.read(UPLOAD_CHUNK_SIZE)
+                        end = offset + len(chunk) - 1
+                        content_range = f"bytes {offset}-{end}/{total}"
+
+                    try:
+                        conn.request(
+                            "PUT",
+                            session_path,
+                            body=chunk,
+                            headers={
+                                "Authorization": f"Bearer {self.access_token}",
+                                "Content-Length": str(len(chunk)),
+                                "Content-Range": content_range,
+                            },
+                        )
+                        response = conn.getresponse()
+                        body = response.read()
+                    except (OSError, http.client.HTTPException) as e:
+                        retries += 1
+                        if retries > UPLOAD_MAX_RETRIES:
+                            raise
+                        logger.warning(f"Upload interrupted at byte {offset}: {e}")
+                        conn.close()
+                        time.sleep(_backoff_delay(retries))
+                        resync = True
+                        continue
+
+                    if response.status in UPLOAD_RETRY_STATUSES:
+                        retries += 1
+                        if retries > UPLOAD_MAX_RETRIES:
+                            raise RuntimeError(
+                                f"Upload failed with HTTP {response.status} "
+                                f"after {UPLOAD_MAX_RETRIES} retries"
+                            )
+                        logger.warning(
+                            f"Upload got HTTP {response.status} at byte {offset}"
+                        )
+                        time.sleep(_backoff_delay(retries))
+                        resync = True
+                        continue
+
+                    resync = False
+                    if response.status in (200, 201):
+                        if on_progress:
+                            on_progress(total, total)
+                        video_id: Optional[str] = json.loads(body).get("id")
+                        return video_id
+
+                    if response.status != 308:
+                        raise RuntimeError(
+                            f"Upload failed with HTTP {response.status}: {body[:200]!r}"
+                        )
+
+                    # 308 Resume Incomplete: Range reports the bytes received
+                    received = self._parse_range_offset(response.getheader("Range"))
+                    if received > offset:
+                        # Only real progress earns a fresh retry budget; a
+                        # status query alone must not, or errors loop forever
+                        retries = 0
+                    offset = received
+                    if on_progress:
+                        on_progress(offset, total)
+        except BaseException:
+            # Drop a connection that may hold a half-read response
+            conn.close()
+            raise
+
+    def _start_upload_session(
+        self,
+        conn: http.client.HTTPConnection,
+        metadata: VideoMetadata,
+        total: int,
+    ) -> str:
+        """Open a resumable upload session.
+
+        Args:
+            conn: Connection to the upload host.
+            metadata: Video metadata sent with the session request.
+            total: Size of the video in bytes.
+
+        Returns:
+            Request path of the session URI to PUT chunks to.
+        """
+        body = json.dumps(
+            {
+                "snippet": {
+                    "title": metadata.title,
+                    "description": metadata.description,
+                    "tags": metadata.tags,
+                    "categoryId": metadata.category_id,
+                },
+                "status": {
+                    "privacyStatus": metadata.privacy_level.value,
+                    "selfDeclaredMadeForKids": metadata.make_for_kids,
+                },
+            }
+        ).encode("utf-8")
+
+        conn.request(
+            "POST",
+            UPLOAD_PATH,
+            body=body,
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json; charset=UTF-8",
+                "X-Upload-Content-Length": str(total),
+                "X-Upload-Content-Type": "video/*",
+            },
+        )
+        response = conn.getresponse()
+        response.read()
+
+        location = response.getheader("Location")
+        if response.status != 200 or not location:
+            raise RuntimeError(
+                f"Could not start upload session: HTTP {response.status}"
+            )
+
+        parts = urlsplit(location)
+        return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    @staticmethod
+    def _parse_range_offset(range_header: Optional[str]) -> int:
+        """Convert a ``Range: bytes=0-N`` header into the next byte offset."""
+        if not range_header:
+            return 0
+        return int(range_header.rsplit("-", 1)[1]) + 1
 
     def set_thumbnail(self, video_id: str, thumbnail_path: Path) -> bool:
         """Set custom thumbnail for uploaded video.
@@ -10,18 +10,120 @@ Features:
 - Add text overlays and captions
 - Adjust video quality and format
 - Frame-by-frame processing capabilities
+
+The add_* and apply_* methods only queue filters; export runs a single FFmpeg
+pass with all of them fused into one filtergraph, so the video is decoded and
+encoded once regardless of how many edits were applied.
 """
 
 from __future__ import annotations
 
+import functools
+import io
 import logging
+import os
+import re
+import subprocess
+import tempfile
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, ClassVar, Iterable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# (video codec, audio codec) per output format; anything else gets H.264/AAC
+_FORMAT_CODECS = {"webm": ("libvpx-vp9", "libopus")}
+
+# FFmpeg muxer names for output formats that differ from the format name
+_FORMAT_MUXERS = {"mkv": "matroska"}
+
+# Speed/quality options per software encoder; -preset only exists for x264
+_ENCODER_OPTIONS: dict[str, tuple[str, ...]] = {
+    "libx264": ("-preset", "fast"),
+    "libvpx-vp9": ("-deadline", "good", "-cpu-used", "4"),
+}
+
+# Effect names accepted by apply_effects that differ from the FFmpeg filter
+_EFFECT_FILTERS = {"blur": "boxblur", "sharpen": "unsharp"}
+
+_OVERLAY_MARGIN = 20
+
+# Raw frame pipes move whole frames (several MB each); the default 8 KB pipe
+# buffer would split every frame into hundreds of read/write calls
+_PIPE_BUFFER_SIZE = 1 << 20
+_BYTES_PER_PIXEL = {"gray": 1, "rgb24": 3, "bgr24": 3, "rgba": 4, "bgra": 4}
+
+# Software pixel format of CUDA frames; scale_cuda converts to it so that
+# hwdownload/hwupload_cuda boundaries always agree on the layout
+_GPU_PIXEL_FORMAT = "nv12"
+_GPU_DOWNLOAD = f"hwdownload,format={_GPU_PIXEL_FORMAT}"
+_GPU_UPLOAD = f"format={_GPU_PIXEL_FORMAT},hwupload_cuda"
+
+# One frame through the pieces the GPU path relies on: CUDA upload and scaling,
+# then NVENC. Distro builds list h264_nvenc even on hosts without an NVIDIA
+# driver or GPU, so only a real encode shows whether it works.
+_NVENC_PROBE = [
+    "ffmpeg", "-v", "error",
+    "-f", "lavfi", "-i", "color=s=256x256:d=0.1",
+    "-vf", f"{_GPU_UPLOAD},scale_cuda=256:256",
+    "-frames:v", "1",
+    "-c:v", "h264_nvenc",
+    "-f", "null", "-",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _nvenc_available() -> bool:
+    """Check once per process whether FFmpeg can encode with NVENC here.
+
+    Returns:
+        True if a one-frame CUDA + h264_nvenc test encode succeeds.
+    """
+    try:
+        result = subprocess.run(_NVENC_PROBE, capture_output=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@functools.lru_cache(maxsize=256)
+def _file_exists(path: str) -> bool:
+    """Check that a path is a regular file, caching the result.
+
+    The cache is cleared by VideoProcessor.export, so files created or
+    removed between exports are seen.
+
+    Args:
+        path: File path.
+
+    Returns:
+        True if the path is an existing regular file.
+    """
+    return os.path.isfile(path)
+
+
+def _read_stderr(stderr_file: IO[bytes]) -> str:
+    """Return the tail of FFmpeg's stderr captured in a temporary file."""
+    stderr_file.seek(0)
+    return stderr_file.read().decode(errors="replace").strip()[-500:]
+
+
+def _escape_filter_value(value: object) -> str:
+    """Escape a filter option value for use inside -filter_complex.
+
+    The value is parsed twice, first by the filtergraph parser and then by
+    the filter's option parser, so it is escaped for both levels.
+
+    Args:
+        value: Option value.
+
+    Returns:
+        Quoted value safe to place after ``key=`` in a filtergraph.
+    """
+    escaped = re.sub(r"([\\':])", r"\\\1", str(value))
+    return "'" + escaped.replace("'", "'\\''") + "'"
+
 
 class TransitionType(Enum):
     """Available transition effects."""
@@ -68,9 +170,42 @@ class TextOverlay:
     opacity: float = 1.0
 
 
+def _overlay_coordinates(position: OverlayPosition) -> tuple[str, str]:
+    """Map an overlay position to drawtext x/y expressions.
+
+    Args:
+        position: Overlay position.
+
+    Returns:
+        Tuple of (x, y) expressions.
+    """
+    left = str(_OVERLAY_MARGIN)
+    top = str(_OVERLAY_MARGIN)
+    center_x = "(w-text_w)/2"
+    right = f"w-text_w-{_OVERLAY_MARGIN}"
+    bottom = f"h-text_h-{_OVERLAY_MARGIN}"
+    return {
+        OverlayPosition.TOP: (center_x, top),
+        OverlayPosition.BOTTOM: (center_x, bottom),
+        OverlayPosition.CENTER: (center_x, "(h-text_h)/2"),
+        OverlayPosition.TOP_LEFT: (left, top),
+        OverlayPosition.TOP_RIGHT: (right, top),
+        OverlayPosition.BOTTOM_LEFT: (left, bottom),
+        OverlayPosition.BOTTOM_RIGHT: (right, bottom),
+    }[position]
+
+
 class VideoProcessor:
     """Handles video editing and post-processing."""
 
+    # quality -> (scale, bitrate)
+    _QUALITY_SETTINGS: ClassVar[dict[str, tuple[str, str]]] = {
+        "480p": ("854:480", "1000k"),
+        "720p": ("1280:720", "2500k"),
+        "1080p": ("1920:1080", "5000k"),
+        "4k": ("3840:2160", "15000k"),
+    }
+
     def __init__(
         self,
         input_video: Path,
@@ -78,6 +213,7 @@ class VideoProcessor:
         width: int = 1920,
         height: int = 1080,
         fps: int = 30,
+        use_gpu: bool = True,
     ):
         """Initialize video processor.
 
@@ -87,14 +223,41 @@ class VideoProcessor:
             width: Output video width.
             height: Output video height.
             fps: Output frames per second.
+            use_gpu: Encode H.264 with NVENC when it works on this host;
+                falls back to libx264 otherwise. Support is probed on first
+                use, not here.
         """
-        self.input_video = Path(input_video)
-        self.output_path = Path(output_path)
+        self.input_video = (
+            input_video if isinstance(input_video, Path) else Path(input_video)
+        )
+        self.output_path = (
+            output_path if isinstance(output_path, Path) else Path(output_path)
+        )
+        # Parts of the default output name, reused for derived output files
+        self._output_stem = self.output_path.stem
+        self._output_suffix = self.output_path.suffix
         self.width = width
         self.height = height
         self.fps = fps
+        self._gpu_requested = use_gpu
 
-        logger.info(f"VideoProcessor initialized: {input_video} -> {output_path}")
+        # Queued edits, applied in order by export in one FFmpeg pass
+        self._filters: list[str] = []
+        # Extra FFmpeg inputs after the video (input 0)
+        self._inputs: list[Path] = []
+        self._narration_input: Optional[int] = None
+        self._narration_volume = 1.0
+
+        logger.info("VideoProcessor initialized: %s -> %s", input_video, output_path)
+
+    @property
+    def use_gpu(self) -> bool:
+        """Whether NVENC is both requested and working (probed once)."""
+        return self._gpu_requested and _nvenc_available()
+
+    @use_gpu.setter
+    def use_gpu(self, value: bool) -> None:
+        self._gpu_requested = value
 
     def add_narration(self, audio_path: Path, volume: float = 1.0) -> None:
         """Add narration audio track to video.
@@ -103,13 +266,16 @@ class VideoProcessor:
             audio_path: Path to audio file (MP3, WAV, etc.).
             volume: Audio volume (0.0 to 1.0).
         """
-        if not audio_path.exists():
-            logger.error(f"Audio file not found: {audio_path}")
+        if not _file_exists(str(audio_path)):
+            logger.error("Audio file not found: %s", audio_path)
             return
 
-        logger.info(f"Adding narration: {audio_path} (volume: {volume})")
-        # Implementation would use FFmpeg to mux audio
-        # ffmpeg -i video.mp4 -i audio.mp3 -c:v copy -c:a aac output.mp4
+        logger.info("Adding narration: %s (volume: %s)", audio_path, volume)
+        self._inputs.append(
+            audio_path if isinstance(audio_path, Path) else Path(audio_path)
+        )
+        self._narration_input = len(self._inputs)
+        self._narration_volume = volume
 
     def add_transitions(self, transitions: list[Transition]) -> None:
         """Add transitions between video segments.
@@ -117,9 +283,15 @@ class VideoProcessor:
         Args:
             transitions: List of transitions to apply.
         """
-        logger.info(f"Adding {len(transitions)} transitions")
-        for i, transition in enumerate(transitions):
-            logger.debug(f"Transition {i}: {transition.transition_type.value} ({transition.duration_ms}ms)")
+        logger.info("Adding %d transitions", len(transitions))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, transition in enumerate(transitions):
+                logger.debug(
+                    "Transition %d: %s (%dms)",
+                    i,
+                    transition.transition_type.value,
+                    transition.duration_ms,
+                )
 
     def add_text_overlay(self, overlay: TextOverlay, start_time_ms: int) -> None:
         """Add text overlay to video.
@@ -129,8 +301,27 @@ class VideoProcessor:
             start_time_ms: When to start overlay (milliseconds).
         """
         logger.info(
-            f"Adding text overlay: '{overlay.text}' at {overlay.position.value} ({start_time_ms}ms)"
+            "Adding text overlay: '%s' at %s (%sms)",
+            overlay.text,
+            overlay.position.value,
+            start_time_ms,
         )
+        x, y = _overlay_coordinates(overlay.position)
+        start = start_time_ms / 1000
+        end = (start_time_ms + overlay.duration_ms) / 1000
+        options = [
+            f"text={_escape_filter_value(overlay.text)}",
+            "expansion=none",
+            f"fontsize={overlay.font_size}",
+            f"fontcolor={overlay.color}@{overlay.opacity}",
+            f"x={_escape_filter_value(x)}",
+            f"y={_escape_filter_value(y)}",
+            f"enable={_escape_filter_value(f'between(t,{start},{end})')}",
+        ]
+        if overlay.background_color:
+            box_color = f"{overlay.background_color}@{overlay.opacity}"
+            options += ["box=1", f"boxcolor={box_color}"]
+        self._filters.append("drawtext=" + ":".join(options))
 
     def add_captions(self, caption_file: Path) -> None:
         """Add subtitle captions from file.
@@ -138,11 +329,12 @@ class VideoProcessor:
         Args:
             caption_file: Path to subtitle file (SRT, VTT, etc.).
         """
-        if not caption_file.exists():
-            logger.error(f"Caption file not found: {caption_file}")
+        if not _file_exists(str(caption_file)):
+            logger.error("Caption file not found: %s", caption_file)
             return
 
-        logger.info(f"Adding captions: {caption_file}")
+        logger.info("Adding captions: %s", caption_file)
+        self._filters.append(f"subtitles=filename={_escape_filter_value(caption_file)}")
 
     def apply_color_correction(self, brightness: float = 1.0, contrast: float = 1.0) -> None:
         """Apply color correction filters.
@@ -151,7 +343,13 @@ class VideoProcessor:
             brightness: Brightness adjustment (1.0 = no change).
             contrast: Contrast adjustment (1.0 = no change).
         """
-        logger.info(f"Applying color correction: brightness={brightness}, contrast={contrast}")
+        logger.info(
+            "Applying color correction: brightness=%s, contrast=%s",
+            brightness,
+            contrast,
+        )
+        # FFmpeg's eq filter treats brightness 0 as unchanged
+        self._filters.append(f"eq=brightness={brightness - 1.0:g}:contrast={contrast}")
 
     def apply_effects(self, effect_name: str, parameters: dict) -> None:
         """Apply video effects.
@@ -160,7 +358,37 @@ class VideoProcessor:
             effect_name: Name of effect (blur, sharpen, etc.).
             parameters: Effect-specific parameters.
         """
-        logger.info(f"Applying effect: {effect_name} with params {parameters}")
+        logger.info("Applying effect: %s with params %s", effect_name, parameters)
+        filter_name = _EFFECT_FILTERS.get(effect_name, effect_name)
+        if parameters:
+            options = ":".join(
+                f"{key}={_escape_filter_value(value)}"
+                for key, value in parameters.items()
+            )
+            filter_name = f"{filter_name}={options}"
+        self._filters.append(filter_name)
+
+    def _build_video_chain(self, scale: str, gpu_frames: bool) -> str:
+        """Join the scale step and queued filters into one filterchain.
+
+        With GPU frames, scaling runs on CUDA. The queued filters are all
+        CPU filters, so frames are downloaded once before them and uploaded
+        again for the encoder.
+
+        Args:
+            scale: Target size as ``W:H``.
+            gpu_frames: Whether decoded frames start out in CUDA memory.
+
+        Returns:
+            Comma-separated filterchain.
+        """
+        if not gpu_frames:
+            return ",".join([f"scale={scale}", *self._filters])
+
+        chain = [f"scale_cuda={scale}:format={_GPU_PIXEL_FORMAT}"]
+        if self._filters:
+            chain += [_GPU_DOWNLOAD, *self._filters, _GPU_UPLOAD]
+        return ",".join(chain)
 
     def export(self, quality: str = "1080p", format: str = "mp4") -> Path:
         """Export processed video to file.
@@ -172,21 +400,241 @@ class VideoProcessor:
         Returns:
             Path to exported video.
         """
-        logger.info(f"Exporting video: {quality} {format} -> {self.output_path}")
-
-        # Build FFmpeg command based on quality
-        quality_settings = {
-            "480p": {"scale": "854:480", "bitrate": "1000k"},
-            "720p": {"scale": "1280:720", "bitrate": "2500k"},
-            "1080p": {"scale": "1920:1080", "bitrate": "5000k"},
-            "4k": {"scale": "3840:2160", "bitrate": "15000k"},
-        }
+        logger.info("Exporting video: %s %s -> %s", quality, format, self.output_path)
+        _file_exists.cache_clear()
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        result, gpu_frames = self._run_export(quality, format)
+        if result.returncode != 0 and gpu_frames:
+            # The probe passed, but the GPU path can still fail on a given
+            # input (e.g. a codec NVDEC can't decode); libx264 always works
+            logger.warning(
+                "GPU export failed, retrying with libx264: %s",
+                result.stderr.strip()[-500:],
+            )
+            self.use_gpu = False
+            result, _ = self._run_export(quality, format)
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg export failed: {result.stderr.strip()[-500:]}")
+
+        return self.output_path
+
+    def _run_export(
+        self, quality: str, format: str
+    ) -> tuple[subprocess.CompletedProcess[str], bool]:
+        """Run the export command once.
+
+        Args:
+            quality: Output quality (480p, 720p, 1080p, 4k).
+            format: Output format (mp4, webm, mov, etc.).
+
+        Returns:
+            The finished FFmpeg process, with stderr captured, and whether
+            the command used the CUDA/NVENC path.
+        """
+        gpu_frames = self._uses_gpu_frames(format)
+        cmd = self.build_export_command(quality, format)
+        logger.debug("FFmpeg command: %s", cmd)
+        try:
+            return subprocess.run(cmd, capture_output=True, text=True), gpu_frames
+        except FileNotFoundError:
+            logger.error("FFmpeg not found. Please install FFmpeg.")
+            raise
+
+    def _uses_gpu_frames(self, format: str) -> bool:
+        """Check whether an export to this format runs on the GPU.
+
+        With NVENC, frames are decoded into and stay in CUDA memory except
+        around queued filters (see _build_video_chain). Only H.264 output
+        has an NVENC encoder here.
+
+        Args:
+            format: Output format (mp4, webm, mov, etc.).
+
+        Returns:
+            True if the export command decodes, scales and encodes with CUDA.
+        """
+        video_codec, _ = _FORMAT_CODECS.get(format, ("libx264", "aac"))
+        return self.use_gpu and video_codec == "libx264"
+
+    def build_export_command(
+        self, quality: str = "1080p", format: str = "mp4"
+    ) -> list[str]:
+        """Build the single FFmpeg command that applies all queued edits.
 
-        settings = quality_settings.get(quality, quality_settings["1080p"])
-        logger.debug(f"Quality settings: {settings}")
+        Args:
+            quality: Output quality (480p, 720p, 1080p, 4k).
+            format: Output format (mp4, webm, mov, etc.).
+
+        Returns:
+            FFmpeg argument list.
+        """
+        scale, bitrate = self._QUALITY_SETTINGS.get(
+            quality, self._QUALITY_SETTINGS["1080p"]
+        )
+        logger.debug("Quality settings: scale=%s, bitrate=%s", scale, bitrate)
+
+        video_codec, audio_codec = _FORMAT_CODECS.get(format, ("libx264", "aac"))
+        gpu_frames = self._uses_gpu_frames(format)
+
+        cmd = ["ffmpeg", "-y"]
+        if gpu_frames:
+            cmd += ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+        cmd += ["-i", str(self.input_video)]
+        for path in self._inputs:
+            cmd += ["-i", str(path)]
+
+        video_chain = self._build_video_chain(scale, gpu_frames)
+        graph = [f"[0:v]{video_chain}[v]"]
+        if self._narration_input is None:
+            audio_map = "0:a?"
+        elif self._narration_volume != 1.0:
+            graph.append(
+                f"[{self._narration_input}:a]volume={self._narration_volume}[a]"
+            )
+            audio_map = "[a]"
+        else:
+            audio_map = f"{self._narration_input}:a"
+
+        if gpu_frames:
+            encoder = ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr"]
+        else:
+            encoder = ["-c:v", video_codec, *_ENCODER_OPTIONS.get(video_codec, ())]
+
+        cmd += [
+            "-filter_complex", ";".join(graph),
+            "-map", "[v]",
+            "-map", audio_map,
+            *encoder,
+            "-b:v", bitrate,
+            "-c:a", audio_codec,
+            "-f", _FORMAT_MUXERS.get(format, format),
+            str(self.output_path),
+        ]
+        return cmd
+
+    def iter_frames(self, pixel_format: str = "rgb24") -> Iterator[memoryview]:
+        """Stream decoded frames of the input video, scaled to width x height.
+
+        The same buffer is reused for every frame, so each yielded view is
+        only valid until the next iteration; copy it with ``bytes()`` to keep
+        it.
+
+        Args:
+            pixel_format: Raw pixel format (gray, rgb24, bgr24, rgba, bgra).
+
+        Yields:
+            One frame of ``width * height * bytes_per_pixel`` bytes.
 
-        # FFmpeg command would be built here
-        # ffmpeg -i input.mp4 -vf scale=1920:1080 -b:v 5000k output.mp4
+        Raises:
+            RuntimeError: If FFmpeg fails to decode the input.
+        """
+        frame_size = self.width * self.height * _BYTES_PER_PIXEL[pixel_format]
+        cmd = [
+            "ffmpeg", "-v", "error",
+            "-i", str(self.input_video),
+            "-vf", f"scale={self.width}:{self.height}",
+            "-f", "rawvideo",
+            "-pix_fmt", pixel_format,
+            "-",
+        ]
+        # stderr goes to a file: an unread pipe fills up and stalls FFmpeg
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=_PIPE_BUFFER_SIZE,
+            )
+            stdout = process.stdout
+            # bufsize > 0 makes Popen wrap the pipe in a BufferedReader
+            assert isinstance(stdout, io.BufferedReader)
+            frame = bytearray(frame_size)
+            view = memoryview(frame)
+            finished = False
+            try:
+                while True:
+                    offset = 0
+                    while offset < frame_size:
+                        count = stdout.readinto(view[offset:])
+                        if not count:
+                            break
+                        offset += count
+                    if offset < frame_size:
+                        finished = True
+                        break
+                    yield view
+            finally:
+                stdout.close()
+                if not finished:
+                    # The caller stopped early; FFmpeg would block on stdout
+                    process.kill()
+                process.wait()
+            if process.returncode != 0:
+                message = _read_stderr(stderr_file)
+                raise RuntimeError(f"FFmpeg decode failed: {message}")
+
+    def write_frames(
+        self, frames: Iterable[Any], pixel_format: str = "rgb24"
+    ) -> Path:
+        """Encode raw frames to the output path.
+
+        Args:
+            frames: Frames of ``width * height`` pixels, as bytes-like objects
+                or arrays. Float arrays are taken to be in [0, 1]; values
+                outside are clipped before conversion to uint8.
+            pixel_format: Raw pixel format of the frames.
+
+        Returns:
+            Path to the encoded video.
+
+        Raises:
+            RuntimeError: If FFmpeg fails, including when it exits before
+                all frames were written.
+        """
+        encoder = "h264_nvenc" if self.use_gpu else "libx264"
+        cmd = [
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "rawvideo",
+            "-pix_fmt", pixel_format,
+            "-s", f"{self.width}x{self.height}",
+            "-r", str(self.fps),
+            "-i", "-",
+            "-c:v", encoder,
+            "-pix_fmt", "yuv420p",
+            str(self.output_path),
+        ]
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=_PIPE_BUFFER_SIZE,
+            )
+            stdin = process.stdin
+            assert stdin is not None
+            try:
+                for frame in frames:
+                    dtype = getattr(frame, "dtype", None)
+                    if dtype is not None and dtype.kind == "f":
+                        frame = frame * 255.0
+                        # Out-of-range values would wrap around in astype
+                        frame.clip(0.0, 255.0, out=frame)
+                        frame = frame.astype("uint8")
+                    stdin.write(frame)
+            except BrokenPipeError:
+                # FFmpeg exited early; its stderr below says why
+                pass
+            finally:
+                try:
+                    stdin.close()
+                except BrokenPipeError:
+                    pass
+                process.wait()
+            if process.returncode != 0:
+                message = _read_stderr(stderr_file)
+                raise RuntimeError(f"FFmpeg encode failed: {message}")
 
         return self.output_path
 
@@ -196,7 +644,7 @@ class VideoProcessor:
         Returns:
             Dictionary with video metadata.
         """
-        logger.info(f"Retrieving video info: {self.input_video}")
+        logger.info("Retrieving video info: %s", self.input_video)
 
         # Would use FFmpeg to get video information
         # ffprobe -v error -select_streams v:0 -show_entries stream=width,height,r_frame_rate ...
@@ -222,9 +670,11 @@ class VideoProcessor:
         Returns:
             Path to trimmed video.
         """
-        out_path = output_path or self.output_path.with_stem(f"{self.output_path.stem}_trimmed")
+        out_path = output_path or self.output_path.with_name(
+            f"{self._output_stem}_trimmed{self._output_suffix}"
+        )
 
-        logger.info(f"Trimming video: {start_ms}ms to {end_ms}ms -> {out_path}")
+        logger.info("Trimming video: %sms to %sms -> %s", start_ms, end_ms, out_path)
         # ffmpeg -i input.mp4 -ss 0 -to 10 -c copy output.mp4
 
         return out_path
@@ -239,9 +689,11 @@ class VideoProcessor:
         Returns:
             Path to concatenated video.
         """
-        out_path = output_path or self.output_path.with_stem(f"{self.output_path.stem}_concat")
+        out_path = output_path or self.output_path.with_name(
+            f"{self._output_stem}_concat{self._output_suffix}"
+        )
 
-        logger.info(f"Concatenating {len(other_videos) + 1} videos -> {out_path}")
+        logger.info("Concatenating %d videos -> %s", len(other_videos) + 1, out_path)
         # Uses FFmpeg concat demuxer
 
         return out_path
@@ -256,9 +708,23 @@ class VideoProcessor:
         Returns:
             Path to thumbnail image.
         """
-        out_path = output_path or self.output_path.with_suffix(".jpg")
-
-        logger.info(f"Creating thumbnail at {time_ms}ms -> {out_path}")
-        # ffmpeg -i input.mp4 -ss 0 -vframes 1 thumbnail.jpg
+        out_path = output_path or self.output_path.with_name(f"{self._output_stem}.jpg")
+
+        logger.info("Creating thumbnail at %sms -> %s", time_ms, out_path)
+        # -ss before -i seeks the demuxer to the nearest keyframe instead of
+        # decoding from the start, and FFmpeg writes the image itself so the
+        # frame never crosses into Python
+        cmd = [
+            "ffmpeg", "-y", "-v", "error",
+            "-ss", f"{time_ms / 1000:.3f}",
+            "-i", str(self.input_video),
+            "-frames:v", "1",
+            str(out_path),
+        ]
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            message = result.stderr.strip()[-500:]
+            raise RuntimeError(f"FFmpeg thumbnail failed: {message}")
 
         return out_path
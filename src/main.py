@@ -1,20 +1,28 @@
 """CLI entry point for hello-app."""
 
-import argparse
 import sys
+from types import SimpleNamespace
 
-from src.dice import DiceRoller
 from src.logger import setup_logger
 
 
-def main() -> int:
+def _parse_args(argv: list[str]) -> SimpleNamespace:
     """
-    Main CLI entry point.
+    Parse command-line arguments.
+
+    A bare invocation takes the defaults directly, without importing or
+    building the argparse parser, which dominates startup for a single roll.
+
+    Args:
+        argv: Arguments after the program name
 
     Returns:
-        Exit code (0 for success, 1 for error)
+        Namespace with rolls, seed, verbose and stats attributes
     """
-    logger = setup_logger(__name__)
+    if not argv:
+        return SimpleNamespace(rolls=1, seed=None, verbose=False, stats=False)
+
+    import argparse
 
     parser = argparse.ArgumentParser(
         description="Enterprise-grade dice rolling application.",
@@ -51,7 +59,21 @@ def main() -> int:
         help="Display statistics (min, max, mean) for rolls",
     )
 
-    args = parser.parse_args()
+    return parser.parse_args(argv, namespace=SimpleNamespace())
+
+
+def main() -> int:
+    """
+    Main CLI entry point.
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    args = _parse_args(sys.argv[1:])
+    logger = setup_logger(__name__)
+
+    # Imported after parsing so --help does not pay for it
+    from src.dice import DiceRoller
 
     # Adjust logging level
     if args.verbose:
@@ -4,25 +4,27 @@ Pytest fixtures and configuration.
 This module provides shared test utilities and fixtures for the test suite.
 """
 
-from typing import List
+from typing import Tuple
 
 import pytest
 
 from src.dice import DiceRoller
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dice_roller() -> DiceRoller:
-    """Provide a standard dice roller instance for tests."""
+    """Provide a standard dice roller instance shared by all tests."""
     return DiceRoller()
 
 
+# Function-scoped: rolling advances the seeded generator, so sharing one
+# instance would make its output depend on test order
 @pytest.fixture
 def seeded_roller() -> DiceRoller:
     """Provide a deterministic dice roller with fixed seed."""
     return DiceRoller(seed=42)
 
-@pytest.fixture
-def sample_rolls() -> List[int]:
-    """Provide sample roll data for statistics tests."""
-    return [1, 2, 3, 4, 5, 6, 1, 2, 3]
+@pytest.fixture(scope="session")
+def sample_rolls() -> Tuple[int, ...]:
+    """Provide immutable sample roll data for statistics tests."""
+    return (1, 2, 3, 4, 5, 6, 1, 2, 3)
@@ -0,0 +1,215 @@
+"""Unit tests for recorder configuration."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.ide_recorder import config as config_module
+from src.ide_recorder.config import RecorderConfig
+
+
+# (msgspec available, orjson available) for each JSON backend
+BACKENDS = {
+    "msgspec": (True, True),
+    "orjson": (False, True),
+    "json": (False, False),
+}
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test once per JSON backend by hiding the faster ones."""
+    has_msgspec, has_orjson = BACKENDS[request.param]
+    if has_msgspec and not config_module._HAS_MSGSPEC:
+        pytest.skip("msgspec is not installed")
+    if has_orjson and not config_module._HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(config_module, "_HAS_MSGSPEC", has_msgspec)
+    monkeypatch.setattr(config_module, "_HAS_ORJSON", has_orjson)
+    return str(request.param)
+
+
+@pytest.fixture
+def secret_config() -> RecorderConfig:
+    """Provide a config with every credential field filled in."""
+    config = RecorderConfig()
+    config.narration.api_key = "sk-narration"
+    config.youtube.client_secret = "client-secret"
+    config.youtube.refresh_token = "refresh-token"
+    return config
+
+
+class TestSecrets:
+    """Test suite for keeping credentials out of saved configs."""
+
+    def test_secrets_not_written_by_default(
+        self, backend: str, secret_config: RecorderConfig, tmp_path: Path
+    ) -> None:
+        """Test that to_json leaves the credential fields out."""
+        path = tmp_path / "config.json"
+        secret_config.to_json(path)
+        text = path.read_text()
+        for secret in ("sk-narration", "client-secret", "refresh-token"):
+            assert secret not in text
+        data = json.loads(text)
+        assert "api_key" not in data["narration"]
+        assert "client_secret" not in data["youtube"]
+        assert "refresh_token" not in data["youtube"]
+
+    def test_secrets_written_when_requested(
+        self, backend: str, secret_config: RecorderConfig, tmp_path: Path
+    ) -> None:
+        """Test that include_secrets=True keeps the credentials."""
+        path = tmp_path / "config.json"
+        secret_config.to_json(path, include_secrets=True)
+        loaded = RecorderConfig.from_json(path)
+        assert loaded.narration.api_key == "sk-narration"
+        assert loaded.youtube.client_secret == "client-secret"
+        assert loaded.youtube.refresh_token == "refresh-token"
+
+    def test_loaded_config_without_secrets_uses_defaults(
+        self, backend: str, secret_config: RecorderConfig, tmp_path: Path
+    ) -> None:
+        """Test that a config saved without secrets loads with empty ones."""
+        path = tmp_path / "config.json"
+        secret_config.to_json(path)
+        loaded = RecorderConfig.from_json(path)
+        assert loaded.narration.api_key == ""
+        assert loaded.youtube.refresh_token == ""
+
+
+class TestToDictCache:
+    """Test suite for the cached RecorderConfig.to_dict summary."""
+
+    def test_repeated_calls_reuse_dict(self) -> None:
+        """Test that an unchanged config returns the same dict."""
+        config = RecorderConfig()
+        assert config.to_dict() is config.to_dict()
+
+    def test_nested_change_invalidates_cache(self) -> None:
+        """Test that writes through a sub-config show up in the summary."""
+        config = RecorderConfig()
+        config.to_dict()
+        config.screen_capture.fps = 60
+        config.narration.model = "gemini-pro"
+        summary = config.to_dict()
+        assert summary["screen_capture"]["fps"] == 60
+        assert summary["narration"]["model"] == "gemini-pro"
+
+    def test_replaced_sub_config_invalidates_cache(self) -> None:
+        """Test that assigning a new sub-config refreshes the summary."""
+        config = RecorderConfig()
+        config.to_dict()
+        config.screen_capture = config_module.ScreenCaptureConfig(fps=24)
+        assert config.to_dict()["screen_capture"]["fps"] == 24
+
+    def test_other_config_change_keeps_cache(self) -> None:
+        """Test that changing one config leaves another's cache valid."""
+        first, second = RecorderConfig(), RecorderConfig()
+        summary = first.to_dict()
+        second.debug_mode = True
+        second.narration.enabled = False
+        assert first.to_dict() is summary
+
+    def test_loaded_config_tracks_changes(
+        self, backend: str, tmp_path: Path
+    ) -> None:
+        """Test that configs built by from_json still invalidate the cache."""
+        path = tmp_path / "config.json"
+        RecorderConfig().to_json(path)
+        loaded = RecorderConfig.from_json(path)
+        loaded.to_dict()
+        loaded.narration.model = "claude-3-sonnet"
+        assert loaded.to_dict()["narration"]["model"] == "claude-3-sonnet"
+
+
+class TestJsonRoundTrip:
+    """Test suite for RecorderConfig.to_json / from_json."""
+
+    def test_round_trip_restores_every_field(
+        self, backend: str, tmp_path: Path
+    ) -> None:
+        """Test that a saved config loads back equal, nested fields included."""
+        config = RecorderConfig(project_name="demo", debug_mode=True)
+        config.output_directory = Path("out/videos")
+        config.screen_capture.fps = 60
+        config.narration.api_endpoint = "https://example.invalid/v1"
+        config.narration.temperature = 0.2
+        config.video_processing.output_path = Path("out/final")
+        config.youtube.tags = ["python", "demo"]
+        path = tmp_path / "config.json"
+        config.to_json(path, include_secrets=True)
+        assert RecorderConfig.from_json(path) == config
+
+    def test_backends_write_the_same_json(self, tmp_path: Path) -> None:
+        """Test that every available backend writes identical data."""
+        config = RecorderConfig(project_name="demo")
+        written = set()
+        for has_msgspec, has_orjson in BACKENDS.values():
+            with pytest.MonkeyPatch.context() as patch:
+                patch.setattr(
+                    config_module,
+                    "_HAS_MSGSPEC",
+                    has_msgspec and config_module._HAS_MSGSPEC,
+                )
+                patch.setattr(
+                    config_module,
+                    "_HAS_ORJSON",
+                    has_orjson and config_module._HAS_ORJSON,
+                )
+                path = tmp_path / "config.json"
+                config.to_json(path)
+                written.add(json.dumps(json.loads(path.read_text()), sort_keys=True))
+        assert len(written) == 1
+
+    def test_missing_and_unknown_keys(self, backend: str, tmp_path: Path) -> None:
+        """Test that missing keys keep defaults and unknown keys are ignored."""
+        path = tmp_path / "config.json"
+        path.write_text(
+            json.dumps({"project_name": "demo", "bogus": 1, "narration": {"x": 2}})
+        )
+        loaded = RecorderConfig.from_json(path)
+        assert loaded.project_name == "demo"
+        assert loaded.narration == RecorderConfig().narration
+
+    def test_int_accepted_for_float(self, backend: str, tmp_path: Path) -> None:
+        """Test that an integer loads into a float field."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"narration": {"temperature": 1}}))
+        assert RecorderConfig.from_json(path).narration.temperature == 1
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"output_directory": None},
+            {"narration": None},
+            ["not", "an", "object"],
+        ],
+    )
+    def test_wrong_types_raise_error(
+        self, backend: str, tmp_path: Path, data: object
+    ) -> None:
+        """Test that every backend rejects malformed sub-configs and paths."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(data))
+        with pytest.raises(ValueError):
+            RecorderConfig.from_json(path)
+
+    @pytest.mark.skipif(
+        not config_module._HAS_MSGSPEC, reason="msgspec is not installed"
+    )
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"screen_capture": {"fps": "30"}},
+            {"debug_mode": 1},
+            {"youtube": {"tags": ["python", 2]}},
+        ],
+    )
+    def test_msgspec_checks_value_types(self, tmp_path: Path, data: object) -> None:
+        """Test that msgspec also rejects scalar values of the wrong type."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(data))
+        with pytest.raises(ValueError):
+            RecorderConfig.from_json(path)
@@ -19,6 +19,14 @@ class TestDiceRollerInitialization:
         roller = DiceRoller(seed=42)
         assert roller is not None
 
+    def test_seed_does_not_touch_global_random(self) -> None:
+        """Test that seeding a roller leaves the global random state alone."""
+        import random
+
+        state = random.getstate()
+        DiceRoller(seed=42).roll_multiple(5)
+        assert random.getstate() == state
+
     def test_dice_roller_constants(self) -> None:
         """Test that dice face constants are correctly defined."""
         assert DiceRoller.MIN_FACE == 1
@@ -104,42 +112,38 @@ class TestMultipleRolls:
 class TestStatistics:
     """Test suite for statistics calculation."""
 
-    def test_calculate_stats_returns_dict(self, sample_rolls: list) -> None:
+    def test_calculate_stats_returns_dict(self, sample_rolls: tuple) -> None:
         """Test that calculate_stats() returns a dictionary."""
         stats = DiceRoller.calculate_stats(sample_rolls)
         assert isinstance(stats, dict)
 
-    def test_calculate_stats_has_required_keys(self, sample_rolls: list) -> None:
+    def test_calculate_stats_has_required_keys(self, sample_rolls: tuple) -> None:
         """Test that stats dict contains all required keys."""
         stats = DiceRoller.calculate_stats(sample_rolls)
         required_keys = {"count", "min", "max", "sum", "mean"}
         assert required_keys.issubset(stats.keys())
 
-    def test_calculate_stats_count(self, sample_rolls: list) -> None:
+    def test_calculate_stats_count(self, sample_rolls: tuple) -> None:
         """Test that count in stats is correct."""
         stats = DiceRoller.calculate_stats(sample_rolls)
         assert stats["count"] == len(sample_rolls)
 
-    def test_calculate_stats_min(self, sample_rolls: list) -> None:
+    def test_calculate_stats_min(self, sample_rolls: tuple) -> None:
         """Test that min in stats is correct."""
         stats = DiceRoller.calculate_stats(sample_rolls)
         assert stats["min"] == min(sample_rolls)
 
-    def test_calculate_stats_max(self, sample_rolls: list) -> None:
+    def test_calculate_stats_max(self, sample_rolls: tuple) -> None:
         """Test that max in stats is correct."""
         stats = DiceRoller.calculate_stats(sample_rolls)
-        assert stats["max"] == max(        
-        # First, check if conftest.py exists in the tests directory
-        
-        ls -la e:\Projects\Python\hello\tests\conftest.py
-        )
+        assert stats["max"] == max(sample_rolls)
 
-    def test_calculate_stats_sum(self, sample_rolls: list) -> None:
+    def test_calculate_stats_sum(self, sample_rolls: tuple) -> None:
         """Test that sum in stats is correct."""
         stats = DiceRoller.calculate_stats(sample_rolls)
         assert stats["sum"] == sum(sample_rolls)
 
-    def test_calculate_stats_mean(self, sample_rolls: list) -> None:
+    def test_calculate_stats_mean(self, sample_rolls: tuple) -> None:
         """Test that mean in stats is calculated correctly."""
         stats = DiceRoller.calculate_stats(sample_rolls)
         expected_mean = sum(sample_rolls) / len(sample_rolls)
@@ -0,0 +1,216 @@
+"""Unit tests for IDE event tracking."""
+
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from src.ide_recorder.events import EventTracker, EventType, IDEEvent, read_event_log
+
+
+@pytest.fixture
+def tracker() -> EventTracker:
+    """Provide an event tracker that is already recording."""
+    tracker = EventTracker()
+    tracker.recording_active = True
+    return tracker
+
+
+def _event(timestamp: int, event_type: EventType = EventType.FILE_SAVED) -> IDEEvent:
+    """Build an event at the given epoch-nanosecond timestamp."""
+    return IDEEvent(event_type=event_type, timestamp=timestamp)
+
+
+class TestTimeRange:
+    """Test suite for EventTracker.get_events_in_timerange."""
+
+    # Sub-microsecond parts just below, at and above the rounding midpoint
+    @pytest.mark.parametrize("nanos", [1, 499, 500, 999])
+    def test_range_bounded_by_own_timestamp_includes_event(
+        self, tracker: EventTracker, nanos: int
+    ) -> None:
+        """Test that an event's own timestamp_dt is an inclusive bound."""
+        event = _event(1_700_000_000_123_456_000 + nanos)
+        tracker.track_event(event)
+        at = event.timestamp_dt
+        assert tracker.get_events_in_timerange(at, at) == [event]
+
+    def test_range_excludes_events_outside_bounds(
+        self, tracker: EventTracker
+    ) -> None:
+        """Test that events a microsecond outside the range are left out."""
+        base = 1_700_000_000_000_000_000
+        before, inside, after = (_event(base + offset) for offset in (0, 1_000, 2_000))
+        for event in (before, inside, after):
+            tracker.track_event(event)
+        at = inside.timestamp_dt
+        assert tracker.get_events_in_timerange(at, at) == [inside]
+        assert tracker.get_events_in_timerange(
+            at - timedelta(microseconds=1), at + timedelta(microseconds=1)
+        ) == [before, inside, after]
+
+
+class TestRingBuffer:
+    """Test suite for the in-memory event cap."""
+
+    def test_oldest_events_are_evicted(self) -> None:
+        """Test that only the newest max_in_memory_events events are kept."""
+        tracker = EventTracker({"max_in_memory_events": 3})
+        tracker.recording_active = True
+        events = [_event(1_000 * i) for i in range(10)]
+        for event in events:
+            tracker.track_event(event)
+        assert list(tracker.events) == events[-3:]
+        assert tracker.get_events_by_type(EventType.FILE_SAVED) == events[-3:]
+        assert tracker.get_statistics()["total_events"] == 3
+
+    def test_time_range_after_eviction(self) -> None:
+        """Test that time-range queries only see events still in memory."""
+        tracker = EventTracker({"max_in_memory_events": 4})
+        tracker.recording_active = True
+        events = [_event(1_700_000_000_000_000_000 + 1_000 * i) for i in range(11)]
+        for event in events:
+            tracker.track_event(event)
+        start, end = events[0].timestamp_dt, events[-1].timestamp_dt
+        assert tracker.get_events_in_timerange(start, end) == events[-4:]
+        at = events[-2].timestamp_dt
+        assert tracker.get_events_in_timerange(at, at) == [events[-2]]
+
+    def test_out_of_order_event_is_sorted_in(self) -> None:
+        """Test that an older event is placed by timestamp within the cap."""
+        tracker = EventTracker({"max_in_memory_events": 3})
+        tracker.recording_active = True
+        first, second, third, late = (_event(t) for t in (1_000, 2_000, 4_000, 3_000))
+        for event in (first, second, third, late):
+            tracker.track_event(event)
+        assert list(tracker.events) == [second, late, third]
+
+    def test_cap_counts_per_type(self) -> None:
+        """Test that evicting the last event of a type drops its count."""
+        tracker = EventTracker({"max_in_memory_events": 2})
+        tracker.recording_active = True
+        tracker.track_event(_event(1, EventType.GIT_COMMIT))
+        tracker.track_event(_event(2))
+        tracker.track_event(_event(3))
+        assert tracker.get_statistics()["event_counts"] == {"file_saved": 2}
+
+    def test_none_disables_cap(self) -> None:
+        """Test that max_in_memory_events=None keeps every event."""
+        tracker = EventTracker({"max_in_memory_events": None})
+        tracker.recording_active = True
+        for i in range(100):
+            tracker.track_event(_event(i))
+        assert len(tracker.events) == 100
+
+    @pytest.mark.parametrize("value", [0, -1, 2.5, "10", True])
+    def test_invalid_cap_raises_error(self, value: object) -> None:
+        """Test that a cap other than a positive int or None is rejected."""
+        with pytest.raises(ValueError):
+            EventTracker({"max_in_memory_events": value})
+
+
+class TestIDEEventMetadata:
+    """Test suite for IDEEvent metadata handling."""
+
+    def test_default_metadata_is_shared_and_empty(self) -> None:
+        """Test that events without metadata serialize an empty dict."""
+        assert _event(1).to_dict()["metadata"] == {}
+
+    def test_set_metadata_leaves_other_events_alone(self) -> None:
+        """Test that setting metadata never writes into the shared default."""
+        first, second = _event(1), _event(2)
+        first.set_metadata("passed", True)
+        first.set_metadata("retries", 2)
+        assert first.to_dict()["metadata"] == {"passed": True, "retries": 2}
+        assert second.to_dict()["metadata"] == {}
+
+
+class TestTrackHelpers:
+    """Test suite for the track_* convenience methods."""
+
+    def test_track_cursor_moved(self, tracker: EventTracker) -> None:
+        """Test that cursor moves record file, line and column."""
+        tracker.track_cursor_moved(Path("a.py"), 3, 7)
+        (event,) = tracker.get_events_by_type(EventType.CURSOR_MOVED)
+        assert (event.file_path, event.line_number, event.column_number) == (
+            Path("a.py"),
+            3,
+            7,
+        )
+
+    def test_track_file_saved_keeps_content(self, tracker: EventTracker) -> None:
+        """Test that file saves record the path and content."""
+        tracker.track_file_saved(Path("a.py"), "print()")
+        (event,) = tracker.get_events_by_type(EventType.FILE_SAVED)
+        assert (event.file_path, event.content) == (Path("a.py"), "print()")
+
+    def test_helpers_ignored_when_not_recording(self) -> None:
+        """Test that helpers record nothing outside a recording session."""
+        tracker = EventTracker()
+        tracker.track_cursor_moved(Path("a.py"), 1, 1)
+        tracker.track_file_saved(Path("a.py"))
+        assert len(tracker.events) == 0
+
+    def test_subclass_override_is_used_while_recording(self) -> None:
+        """Test that starting a session does not bypass subclass overrides."""
+        calls = []
+
+        class CountingTracker(EventTracker):
+            def track_cursor_moved(
+                self, file_path: Path, line: int, column: int
+            ) -> None:
+                calls.append(line)
+
+        tracker = CountingTracker()
+        tracker.start_tracking()
+        tracker.track_cursor_moved(Path("a.py"), 5, 0)
+        assert calls == [5]
+
+
+class TestEventLog:
+    """Test suite for the length-prefixed event log."""
+
+    def test_log_replays_every_event(self, tmp_path: Path) -> None:
+        """Test that read_event_log yields each tracked event in order."""
+        log_path = tmp_path / "events.log"
+        tracker = EventTracker({"event_log_path": log_path})
+        tracker.start_tracking()
+        tracker.track_file_saved(Path("a.py"), "x = 1\n")
+        tracker.track_git_commit("Add a", 1)
+        tracker.stop_tracking()
+
+        replayed = list(read_event_log(log_path))
+        assert [entry["event_type"] for entry in replayed] == [
+            "recording_started",
+            "file_saved",
+            "git_commit",
+        ]
+        assert replayed[1]["content"] == "x = 1\n"
+        assert replayed[2]["metadata"] == {"files_changed": 1}
+        assert replayed == [event.to_dict() for event in tracker.events]
+
+    def test_log_keeps_events_evicted_from_memory(self, tmp_path: Path) -> None:
+        """Test that the log holds the full session beyond the in-memory cap."""
+        log_path = tmp_path / "events.log"
+        tracker = EventTracker(
+            {"event_log_path": log_path, "max_in_memory_events": 2}
+        )
+        tracker.start_tracking()
+        for line in range(5):
+            tracker.track_cursor_moved(Path("a.py"), line, 0)
+        tracker.stop_tracking()
+        assert len(tracker.events) == 2
+        assert len(list(read_event_log(log_path))) == 6
+
+    def test_truncated_frame_ends_replay(self, tmp_path: Path) -> None:
+        """Test that a frame cut short mid-write is dropped, not raised."""
+        log_path = tmp_path / "events.log"
+        tracker = EventTracker({"event_log_path": log_path})
+        tracker.start_tracking()
+        tracker.track_file_modified(Path("a.py"))
+        tracker.stop_tracking()
+        data = log_path.read_bytes()
+        log_path.write_bytes(data[:-3])
+        assert [entry["event_type"] for entry in read_event_log(log_path)] == [
+            "recording_started"
+        ]
@@ -0,0 +1,245 @@
+"""Tests for the resumable YouTube uploader against a local server."""
+
+import asyncio
+import http.client
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.ide_recorder import uploader as uploader_module
+from src.ide_recorder.uploader import (
+    UPLOAD_MAX_RETRIES,
+    VideoMetadata,
+    YouTubeUploader,
+    _backoff_delay,
+)
+
+CHUNK_SIZE = 1024
+
+
+class FakeUploadServer(ThreadingHTTPServer):
+    """Local stand-in for the YouTube resumable upload endpoint."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _UploadHandler)
+        self.lock = threading.Lock()
+        self.sessions: dict[str, bytearray] = {}
+        # Scripted faults for upcoming chunk PUTs: an HTTP status to answer
+        # with, or "drop" to read the chunk and close without replying
+        self.faults: list[object] = []
+        self.requests: list[str] = []
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeUploadServer
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes = b"", **headers: str) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            session = f"/session/{len(self.server.sessions)}"
+            self.server.sessions[session] = bytearray()
+        host, port = self.server.server_address[:2]
+        self._reply(200, Location=f"http://{host}:{port}{session}?upload_id=1")
+
+    def do_PUT(self) -> None:
+        chunk = self.rfile.read(int(self.headers["Content-Length"]))
+        session = self.path.split("?")[0]
+        content_range = self.headers["Content-Range"]
+        with self.server.lock:
+            self.server.requests.append(content_range)
+            received = self.server.sessions[session]
+            fault = self.server.faults.pop(0) if chunk and self.server.faults else None
+        if fault == "drop":
+            self.close_connection = True
+            return
+        if isinstance(fault, int):
+            self._reply(fault)
+            return
+        # "bytes a-b/total" stores the chunk; "bytes */total" only asks status
+        span, total = content_range[len("bytes ") :].split("/")
+        if span != "*":
+            start = int(span.split("-")[0])
+            assert start == len(received), "chunk does not continue the upload"
+            received.extend(chunk)
+        if len(received) == int(total):
+            self._reply(200, json.dumps({"id": session.rsplit("/", 1)[1]}).encode())
+        elif received:
+            self._reply(308, Range=f"bytes=0-{len(received) - 1}")
+        else:
+            self._reply(308)
+
+
+class LocalUploader(YouTubeUploader):
+    """Uploader that talks plain HTTP to the fake server."""
+
+    def __init__(self, server: FakeUploadServer) -> None:
+        super().__init__(refresh_token="refresh-token")
+        self._server_address = server.server_address[:2]
+        self._access_token = "access-token"
+        self._token_expires_at = float("inf")
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        host, port = self._server_address
+        return http.client.HTTPConnection(host, port, timeout=5)
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeUploadServer]:
+    """Run a fake upload server and use small chunks against it."""
+    monkeypatch.setattr(uploader_module, "UPLOAD_CHUNK_SIZE", CHUNK_SIZE)
+    server = FakeUploadServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record backoff sleeps instead of waiting."""
+    recorded: list[float] = []
+    monkeypatch.setattr(uploader_module.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.fixture
+def metadata() -> VideoMetadata:
+    """Provide minimal upload metadata."""
+    return VideoMetadata(title="Demo", description="", tags=[])
+
+
+def _video(tmp_path: Path, name: str, size: int) -> tuple[Path, bytes]:
+    """Write a video file of the given size with recognizable content."""
+    data = bytes(i % 251 for i in range(size))
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path, data
+
+
+class TestConcurrentUploads:
+    """Test suite for uploads sharing one uploader across threads."""
+
+    def test_async_uploads_run_concurrently(
+        self, server: FakeUploadServer, metadata: VideoMetadata, tmp_path: Path
+    ) -> None:
+        """Test that overlapping async uploads each complete intact."""
+        videos = [_video(tmp_path, f"v{i}.mp4", 20 * CHUNK_SIZE + i) for i in range(4)]
+
+        async def upload_all(uploader: YouTubeUploader) -> list:
+            return await asyncio.gather(
+                *(uploader.upload_video_async(path, metadata) for path, _ in videos)
+            )
+
+        with LocalUploader(server) as uploader:
+            video_ids = asyncio.run(upload_all(uploader))
+
+        assert None not in video_ids
+        uploaded = {bytes(server.sessions[f"/session/{vid}"]) for vid in video_ids}
+        assert uploaded == {data for _, data in videos}
+
+    def test_close_releases_every_thread_connection(
+        self, server: FakeUploadServer, metadata: VideoMetadata, tmp_path: Path
+    ) -> None:
+        """Test that close() drops connections opened on worker threads."""
+        path, _ = _video(tmp_path, "v.mp4", 3 * CHUNK_SIZE)
+        uploader = LocalUploader(server)
+        worker = threading.Thread(target=uploader.upload_video, args=(path, metadata))
+        worker.start()
+        worker.join()
+        assert len(uploader._conns) == 1
+        uploader.close()
+        assert not uploader._conns
+
+
+class TestResumableUpload:
+    """Test suite for resuming interrupted uploads."""
+
+    @pytest.mark.parametrize("fault", ["drop", 500, 502, 503, 504])
+    def test_upload_resumes_after_fault(
+        self,
+        server: FakeUploadServer,
+        metadata: VideoMetadata,
+        tmp_path: Path,
+        sleeps: list[float],
+        fault: object,
+    ) -> None:
+        """Test that a dropped connection or 5xx resumes from the server's offset."""
+        path, data = _video(tmp_path, "v.mp4", 5 * CHUNK_SIZE + 10)
+        server.faults = [None, None, fault]
+        with LocalUploader(server) as uploader:
+            video_id = uploader.upload_video(path, metadata)
+
+        assert video_id == "0"
+        assert bytes(server.sessions["/session/0"]) == data
+        # The third chunk failed, so the status query follows it and the
+        # upload continues from byte 2 * CHUNK_SIZE rather than byte 0
+        status_query = server.requests.index(f"bytes */{len(data)}")
+        assert server.requests[status_query + 1].startswith(f"bytes {2 * CHUNK_SIZE}-")
+        assert len(sleeps) == 1
+
+    def test_upload_gives_up_after_max_retries(
+        self,
+        server: FakeUploadServer,
+        metadata: VideoMetadata,
+        tmp_path: Path,
+        sleeps: list[float],
+    ) -> None:
+        """Test that persistent server errors stop after UPLOAD_MAX_RETRIES."""
+        path, _ = _video(tmp_path, "v.mp4", 3 * CHUNK_SIZE)
+        server.faults = [503] * (UPLOAD_MAX_RETRIES + 1)
+        with LocalUploader(server) as uploader:
+            assert uploader.upload_video(path, metadata) is None
+        assert len(sleeps) == UPLOAD_MAX_RETRIES
+
+    def test_client_error_is_not_retried(
+        self,
+        server: FakeUploadServer,
+        metadata: VideoMetadata,
+        tmp_path: Path,
+        sleeps: list[float],
+    ) -> None:
+        """Test that a 4xx response fails the upload without retrying."""
+        path, _ = _video(tmp_path, "v.mp4", 3 * CHUNK_SIZE)
+        server.faults = [403]
+        with LocalUploader(server) as uploader:
+            assert uploader.upload_video(path, metadata) is None
+        assert sleeps == []
+        assert len(server.requests) == 1
+
+
+class TestBackoffDelay:
+    """Test suite for the retry backoff schedule."""
+
+    def test_delay_doubles_with_jitter(self) -> None:
+        """Test that each attempt's delay lies in [half, full] of its ceiling."""
+        base = uploader_module.UPLOAD_BACKOFF_BASE_SECONDS
+        for attempt in range(1, 4):
+            ceiling = base * 2 ** (attempt - 1)
+            for _ in range(20):
+                assert ceiling / 2 <= _backoff_delay(attempt) <= ceiling
+
+    def test_delay_is_capped(self) -> None:
+        """Test that late attempts never wait longer than the cap."""
+        cap = uploader_module.UPLOAD_BACKOFF_MAX_SECONDS
+        assert all(_backoff_delay(30) <= cap for _ in range(20))
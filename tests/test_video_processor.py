@@ -0,0 +1,287 @@
+"""Unit tests for the FFmpeg-based video processor."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.ide_recorder import video_processor as video_processor_module
+from src.ide_recorder.video_processor import (
+    OverlayPosition,
+    TextOverlay,
+    VideoProcessor,
+    _escape_filter_value,
+)
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg is not installed"
+)
+
+
+@pytest.fixture
+def processor(tmp_path: Path) -> VideoProcessor:
+    """Provide a CPU-only processor writing into a temporary directory."""
+    return VideoProcessor(
+        tmp_path / "input.mp4",
+        tmp_path / "out" / "output.mp4",
+        width=64,
+        height=48,
+        fps=10,
+        use_gpu=False,
+    )
+
+
+@pytest.fixture
+def input_video(tmp_path: Path) -> Path:
+    """Render a short test clip with FFmpeg."""
+    path = tmp_path / "input.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-f", "lavfi", "-i", "testsrc=s=64x48:r=10:d=1",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p",
+            str(path),
+        ],
+        check=True,
+    )
+    return path
+
+
+def _option(cmd: list, flag: str) -> str:
+    """Return the value following a flag in an FFmpeg argument list."""
+    return cmd[cmd.index(flag) + 1]
+
+
+class TestEscapeFilterValue:
+    """Test suite for _escape_filter_value."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("plain", "'plain'"),
+            ("a:b", "'a\\:b'"),
+            ("back\\slash", "'back\\\\slash'"),
+            ("it's", "'it\\'\\''s'"),
+            (1.5, "'1.5'"),
+        ],
+    )
+    def test_escaped_value(self, value: object, expected: str) -> None:
+        """Test escaping for the filtergraph and option parsers."""
+        assert _escape_filter_value(value) == expected
+
+    @requires_ffmpeg
+    @pytest.mark.parametrize(
+        "value",
+        ["it's 5:00", "a,b;c[d]e", "back\\slash = \\'", "%{pts}", "''"],
+    )
+    def test_ffmpeg_reads_back_original_value(self, value: str) -> None:
+        """Test that FFmpeg parses the escaped value back to the original."""
+        graph = (
+            "color=s=16x16:d=0.1,"
+            f"metadata=mode=add:key=k:value={_escape_filter_value(value)},"
+            "metadata=mode=print:file=-"
+        )
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", graph, "-f", "null", "-"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert f"k={value}\n" in result.stdout
+
+
+class TestExportCommand:
+    """Test suite for VideoProcessor.build_export_command."""
+
+    def test_mp4_uses_x264_preset(self, processor: VideoProcessor) -> None:
+        """Test that H.264 output gets the x264 speed preset."""
+        cmd = processor.build_export_command("720p", "mp4")
+        assert _option(cmd, "-c:v") == "libx264"
+        assert _option(cmd, "-preset") == "fast"
+        assert _option(cmd, "-f") == "mp4"
+        assert _option(cmd, "-b:v") == "2500k"
+
+    def test_webm_has_no_x264_options(self, processor: VideoProcessor) -> None:
+        """Test that VP9 output gets libvpx options instead of -preset."""
+        cmd = processor.build_export_command("1080p", "webm")
+        assert _option(cmd, "-c:v") == "libvpx-vp9"
+        assert "-preset" not in cmd
+        assert _option(cmd, "-deadline") == "good"
+        assert _option(cmd, "-c:a") == "libopus"
+
+    def test_mkv_uses_matroska_muxer(self, processor: VideoProcessor) -> None:
+        """Test that mkv output is written with the matroska muxer."""
+        cmd = processor.build_export_command("1080p", "mkv")
+        assert _option(cmd, "-f") == "matroska"
+
+    def test_queued_filters_form_one_chain(
+        self, processor: VideoProcessor
+    ) -> None:
+        """Test that edits are fused, in order, into one filterchain."""
+        processor.apply_color_correction(brightness=1.2, contrast=1.1)
+        processor.apply_effects("blur", {"luma_radius": 2})
+        text = "Step 1: it's done"
+        processor.add_text_overlay(TextOverlay(text, OverlayPosition.TOP), 500)
+        cmd = processor.build_export_command("480p", "mp4")
+        chain = _option(cmd, "-filter_complex").split("[v]")[0]
+        assert chain.startswith("[0:v]scale=854:480,eq=brightness=0.2:contrast=1.1,")
+        assert "boxblur=luma_radius='2'" in chain
+        assert f"drawtext=text={_escape_filter_value(text)}:" in chain
+
+    def test_narration_volume_adds_audio_filter(
+        self, processor: VideoProcessor, tmp_path: Path
+    ) -> None:
+        """Test that a narration track below full volume is mixed via a filter."""
+        audio = tmp_path / "narration.wav"
+        audio.write_bytes(b"")
+        processor.add_narration(audio, volume=0.5)
+        cmd = processor.build_export_command()
+        assert cmd.count("-i") == 2
+        assert "[1:a]volume=0.5[a]" in _option(cmd, "-filter_complex")
+        assert cmd[cmd.index("-map", cmd.index("-map") + 1) + 1] == "[a]"
+
+
+class TestGpuSelection:
+    """Test suite for NVENC detection and fallback."""
+
+    def test_probe_failure_to_start_means_no_gpu(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an OSError launching FFmpeg disables NVENC."""
+
+        def refuse(*args: object, **kwargs: object) -> None:
+            raise PermissionError("ffmpeg is not executable")
+
+        monkeypatch.setattr(video_processor_module.subprocess, "run", refuse)
+        video_processor_module._nvenc_available.cache_clear()
+        try:
+            assert video_processor_module._nvenc_available() is False
+        finally:
+            video_processor_module._nvenc_available.cache_clear()
+
+    def test_constructor_does_not_probe(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that creating a processor starts no FFmpeg process."""
+        probes = []
+        monkeypatch.setattr(
+            video_processor_module, "_nvenc_available", lambda: probes.append(1)
+        )
+        VideoProcessor(tmp_path / "in.mp4", tmp_path / "out.mp4")
+        assert probes == []
+
+    def test_use_gpu_false_skips_probe(
+        self, monkeypatch: pytest.MonkeyPatch, processor: VideoProcessor
+    ) -> None:
+        """Test that NVENC is never probed when the GPU is not requested."""
+        monkeypatch.setattr(video_processor_module, "_nvenc_available", pytest.fail)
+        assert _option(processor.build_export_command(), "-c:v") == "libx264"
+
+    def test_gpu_chain_downloads_once_around_filters(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that queued filters run between one CUDA download/upload."""
+        monkeypatch.setattr(video_processor_module, "_nvenc_available", lambda: True)
+        processor = VideoProcessor(tmp_path / "in.mp4", tmp_path / "out.mp4")
+        cmd = processor.build_export_command("480p", "mp4")
+        chain = "[0:v]scale_cuda=854:480:format=nv12[v]"
+        assert _option(cmd, "-filter_complex") == chain
+        assert _option(cmd, "-c:v") == "h264_nvenc"
+
+        processor.apply_color_correction(brightness=1.2)
+        processor.apply_effects("blur", {})
+        cmd = processor.build_export_command("480p", "mp4")
+        assert _option(cmd, "-filter_complex") == (
+            "[0:v]scale_cuda=854:480:format=nv12,hwdownload,format=nv12,"
+            "eq=brightness=0.2:contrast=1.0,boxblur,"
+            "format=nv12,hwupload_cuda[v]"
+        )
+
+    @requires_ffmpeg
+    def test_export_falls_back_to_libx264(
+        self, monkeypatch: pytest.MonkeyPatch, input_video: Path, tmp_path: Path
+    ) -> None:
+        """Test that a failing GPU export is retried on the CPU."""
+        monkeypatch.setattr(video_processor_module, "_nvenc_available", lambda: True)
+        monkeypatch.setattr(
+            VideoProcessor, "_QUALITY_SETTINGS", {"1080p": ("64:48", "100k")}
+        )
+        processor = VideoProcessor(input_video, tmp_path / "out.mp4", use_gpu=True)
+        # Force the GPU attempt to fail even on hosts where NVENC works
+        processor._filters.append("null")
+        monkeypatch.setattr(
+            video_processor_module,
+            "_GPU_DOWNLOAD",
+            "hwdownload,format=not_a_pixel_format",
+        )
+        output = processor.export()
+        assert output.stat().st_size > 0
+        assert processor.use_gpu is False
+
+    @requires_ffmpeg
+    def test_cpu_export_failure_keeps_gpu(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that a failure off the GPU path does not disable NVENC."""
+        monkeypatch.setattr(video_processor_module, "_nvenc_available", lambda: True)
+        broken_video = tmp_path / "broken.mp4"
+        broken_video.write_bytes(b"not a video")
+        processor = VideoProcessor(broken_video, tmp_path / "out.webm", use_gpu=True)
+        with pytest.raises(RuntimeError, match="FFmpeg export failed"):
+            processor.export(format="webm")
+        assert processor.use_gpu is True
+
+
+@requires_ffmpeg
+class TestRawFrames:
+    """Test suite for streaming raw frames through FFmpeg pipes."""
+
+    def test_iter_frames_yields_every_frame(
+        self, input_video: Path, tmp_path: Path
+    ) -> None:
+        """Test that every decoded frame is yielded at the output size."""
+        processor = VideoProcessor(
+            input_video, tmp_path / "out.mp4", width=32, height=24, use_gpu=False
+        )
+        sizes = [len(frame) for frame in processor.iter_frames("rgb24")]
+        assert sizes == [32 * 24 * 3] * 10
+
+    def test_iter_frames_stopped_early(
+        self, input_video: Path, tmp_path: Path
+    ) -> None:
+        """Test that abandoning the iterator stops FFmpeg without raising."""
+        processor = VideoProcessor(input_video, tmp_path / "out.mp4", use_gpu=False)
+        frames = processor.iter_frames("gray")
+        next(frames)
+        frames.close()
+
+    def test_iter_frames_bad_input_raises_error(self, tmp_path: Path) -> None:
+        """Test that a decode failure raises instead of yielding nothing."""
+        bad_input = tmp_path / "broken.mp4"
+        bad_input.write_bytes(b"not a video")
+        processor = VideoProcessor(bad_input, tmp_path / "out.mp4", use_gpu=False)
+        with pytest.raises(RuntimeError, match="FFmpeg decode failed"):
+            list(processor.iter_frames())
+
+    def test_write_frames_clips_float_frames(self, tmp_path: Path) -> None:
+        """Test that float values above 1.0 saturate instead of wrapping."""
+        np = pytest.importorskip("numpy")
+        processor = VideoProcessor(
+            tmp_path / "in.mp4", tmp_path / "out.mp4", 64, 48, use_gpu=False
+        )
+        frames = [np.full((48, 64, 3), 1.5, dtype=np.float32)] * 5
+        output = processor.write_frames(frames)
+
+        decoded = VideoProcessor(output, tmp_path / "unused.mp4", 64, 48, use_gpu=False)
+        for frame in decoded.iter_frames("gray"):
+            assert min(frame) > 240
+
+    def test_write_frames_reports_early_exit(self, tmp_path: Path) -> None:
+        """Test that FFmpeg exiting early surfaces its error, not a broken pipe."""
+        processor = VideoProcessor(
+            tmp_path / "in.mp4", tmp_path / "out.mp4", 64, 48, use_gpu=False
+        )
+        frames = (bytes(64 * 48 * 3) for _ in range(200))
+        with pytest.raises(RuntimeError, match="FFmpeg encode failed: .+"):
+            processor.write_frames(frames, pixel_format="not_a_pixel_format")